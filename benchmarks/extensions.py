@@ -0,0 +1,83 @@
+# Shows that supporting extension claims does not slow down from_dict() for
+# payloads without them.
+#
+# "reflection" is the from_data() implementation that predates the extension
+# registry, which inspected jc_map and the type annotations for every field of
+# every call; "current" is BaseJCSerializable.from_data().
+#
+#   python -m benchmarks.extensions [--submods N]
+import argparse
+import timeit
+from functools import partial
+from typing import get_args
+
+from benchmarks.payloads import payload
+from src.base import ExtensionClaim
+from src.claims import AttestationResult
+
+
+def reflection_from_data(cls, data, keys_as_int=False):
+    key_attr = "int_key" if keys_as_int else "str_key"
+    init_kwargs = {}
+    reverse_map = {
+        getattr(mapping, key_attr): attr for attr, mapping in cls.jc_map.items()
+    }
+    for key, value in data.items():
+        if key not in reverse_map:
+            continue
+        attr = reverse_map[key]
+        field_type = getattr(cls, "__annotations__", {}).get(attr)
+        if field_type is None:
+            continue
+        args = get_args(field_type)
+        if hasattr(field_type, "jc_map"):
+            init_kwargs[attr] = reflection_from_data(field_type, value, keys_as_int)
+        elif hasattr(field_type, "from_data"):
+            init_kwargs[attr] = field_type.from_data(value, keys_as_int)
+        elif hasattr(field_type, "items") and hasattr(args[1], "from_data"):
+            init_kwargs[attr] = {
+                k: reflection_from_data(args[1], v, keys_as_int)
+                for k, v in value.items()
+            }
+        elif args:
+            init_kwargs[attr] = args[0](value)
+        else:
+            init_kwargs[attr] = field_type(value)
+    return cls(**init_kwargs)
+
+
+def best(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extension claims overhead")
+    parser.add_argument("--submods", type=int, default=8)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    plain = payload(args.submods)
+    extended = payload(args.submods)
+    extended["acme.location"] = [51.5, -0.1]
+    extended["acme.opaque"] = "kept as is"
+    for submod in extended["submods"].values():
+        submod["acme.component-hash"] = "sha-256;abcd"
+    AttestationResult.register_extension(
+        ExtensionClaim("location", -70001, "acme.location", decode=tuple, encode=list)
+    )
+
+    rows = (
+        (
+            "reflection, no extensions",
+            partial(reflection_from_data, AttestationResult, plain),
+        ),
+        ("current, no extensions", partial(AttestationResult.from_dict, plain)),
+        ("current, with extensions", partial(AttestationResult.from_dict, extended)),
+    )
+    print(f"{'from_dict':<28} {'us/call':>8}")
+    for name, function in rows:
+        print(f"{name:<28} {best(function, args.number):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
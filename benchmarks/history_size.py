@@ -0,0 +1,74 @@
+# Compares the storage cost of an EARHistory with storing every EAR in full.
+#
+# A synthetic attester produces EARs that mostly repeat the previous one, with
+# an occasional change of a trust claim, the way a real appraisal history does.
+#
+#   python -m benchmarks.history_size [--results N] [--submods N]
+import argparse
+import random
+
+import cbor2
+
+from src.claims import AttestationResult
+from src.history import DEFAULT_KEYFRAME_INTERVAL, EARHistory
+from src.submod import Submod
+from src.trust_claims import TrustClaim
+from src.trust_tier import TRUST_TIER_AFFIRMING, TRUST_TIER_WARNING
+from src.trust_vector import TrustVector
+from src.verifier_id import VerifierID
+
+
+def synthetic_history(count: int, submods: int, seed: int = 0):
+    rng = random.Random(seed)
+    vectors = {f"component-{n}": [2] * 8 for n in range(submods)}
+    for sequence in range(count):
+        if rng.random() < 0.2:
+            values = vectors[rng.choice(list(vectors))]
+            values[rng.randrange(8)] = rng.choice([2, 3, 32, 96])
+        yield AttestationResult(
+            profile="tag:github.com,2023:veraison/ear",
+            issued_at=1700000000 + sequence * 300,
+            verifier_id=VerifierID(developer="Acme Inc.", build="v1.2.3"),
+            submods={
+                name: Submod(
+                    trust_vector=TrustVector(*(TrustClaim(value) for value in values)),
+                    status=(
+                        TRUST_TIER_AFFIRMING if max(values) < 32 else TRUST_TIER_WARNING
+                    ),
+                )
+                for name, values in vectors.items()
+            },
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EARHistory storage reduction")
+    parser.add_argument("--results", type=int, default=1000)
+    parser.add_argument("--submods", type=int, default=4)
+    parser.add_argument(
+        "--keyframe-interval", type=int, default=DEFAULT_KEYFRAME_INTERVAL
+    )
+    args = parser.parse_args()
+
+    history = EARHistory(keyframe_interval=args.keyframe_interval)
+    json_size = cbor_size = 0
+    for result in synthetic_history(args.results, args.submods):
+        json_size += len(result.to_json())
+        cbor_size += len(cbor2.dumps(result.to_int_keys()))
+        history.append(result)
+    history_size = len(history.to_bytes())
+
+    print(f"{'format':<14} {'bytes':>10} {'per EAR':>8} {'reduction':>10}")
+    for name, size in (
+        ("full JSON", json_size),
+        ("full CBOR", cbor_size),
+        ("EARHistory", history_size),
+    ):
+        print(
+            f"{name:<14} {size:>10} {size / args.results:>8.1f} "
+            f"{json_size / size:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# Tracks the import cost of the public entry points using `python -X importtime`.
+#
+# Each module is imported in a fresh interpreter several times and the best
+# cumulative time (in microseconds) reported by the interpreter is kept, along
+# with the heaviest third-party modules pulled in along the way.
+#
+#   python -m benchmarks.import_time [--repeat N] [module ...]
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ENTRY_POINTS = [
+    "src.base",
+    "src.trust_tier",
+    "src.trust_claims",
+    "src.trust_vector",
+    "src.verifier_id",
+    "src.submod",
+    "src.claims",
+    "src.jwt_config",
+]
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    # Maps each imported module to its cumulative import time in microseconds
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def importtime(statement: str) -> Dict[str, int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def measure(module: str, repeat: int = 5) -> Tuple[int, Dict[str, int]]:
+    best = None
+    best_timings: Dict[str, int] = {}
+    for _ in range(repeat):
+        timings = importtime(f"import {module}")
+        total = timings[module]
+        if best is None or total < best:
+            best, best_timings = total, timings
+    return best or 0, best_timings
+
+
+def heaviest_dependencies(
+    timings: Dict[str, int], startup: Dict[str, int], top: int = 3
+) -> List[str]:
+    # Top-level packages outside src, and not already loaded by the interpreter
+    # at startup, sorted by their cumulative import time
+    roots = {
+        name: value
+        for name, value in timings.items()
+        if "." not in name and name != "src" and name not in startup
+    }
+    return sorted(roots, key=roots.__getitem__, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time of src entry points")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("modules", nargs="*", default=ENTRY_POINTS)
+    args = parser.parse_args()
+
+    startup = importtime("pass")
+    print(f"{'module':<20} {'import (us)':>12}  heaviest dependencies")
+    for module in args.modules:
+        total, timings = measure(module, args.repeat)
+        deps = ", ".join(heaviest_dependencies(timings, startup))
+        print(f"{module:<20} {total:>12}  {deps}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# Compares verifying a token signed with a rotated key by KeyRing.verify(),
+# which selects the key from the "kid" header, with trial verification
+# against every past key through verify_jwt().
+#
+#   python -m benchmarks.key_rotation [--rotations N]
+import argparse
+import timeit
+from functools import partial
+
+from src.claims import verify_jwt
+from src.clock import FixedClock
+from src.keys import KeyRing
+
+
+def trial_verify(token: str, keys, clock):
+    # Newest key first, as most tokens are recent
+    for key in keys:
+        try:
+            return verify_jwt(token, key, clock=clock)
+        except ValueError:
+            pass
+    raise ValueError("no key verifies the token")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Key rotation")
+    parser.add_argument("--rotations", type=int, default=8)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    clock = FixedClock(1_700_000_000)
+    keyring = KeyRing(
+        "master-secret", epoch_seconds=60, window=args.rotations + 1, clock=clock
+    )
+    # Signed at the oldest still-active epoch
+    token = keyring.sign({"iat": clock.now(), "foo": "bar"})
+    clock.timestamp += args.rotations * keyring.epoch_seconds
+    current = keyring.epoch()
+    keys = [keyring.key(current - n) for n in range(args.rotations + 1)]
+
+    rows = (
+        (f"trial over {len(keys)} keys", partial(trial_verify, token, keys, clock)),
+        ("KeyRing.verify", partial(keyring.verify, token)),
+    )
+    print(f"{'verification':<22} {'us/call':>8}")
+    for name, function in rows:
+        best = min(timeit.repeat(function, number=args.number, repeat=5))
+        print(f"{name:<22} {best / args.number * 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
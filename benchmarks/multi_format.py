@@ -0,0 +1,43 @@
+# Compares serving one AttestationResult in several formats with the
+# per-format methods against a single codec.encode() call.
+#
+#   python -m benchmarks.multi_format [--submods N]
+import argparse
+import timeit
+from functools import partial
+
+import cbor2
+
+from benchmarks.payloads import sample_result
+from src.claims import AttestationResult
+from src.codec import FORMATS, encode
+
+
+def separately(result: AttestationResult, secret_key: str):
+    return {
+        "json": result.to_json(),
+        "jwt": result.encode_jwt(secret_key),
+        "cbor": cbor2.dumps(result.to_int_keys()),
+        "cwt": result.encode_cwt(secret_key),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-format encoding")
+    parser.add_argument("--submods", type=int, default=8)
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    result = sample_result(args.submods)
+    rows = (
+        ("per-format methods", partial(separately, result, "secret")),
+        ("codec.encode", partial(encode, result, FORMATS, "secret")),
+    )
+    print(f"{'all four formats':<20} {'us/call':>8}")
+    for name, function in rows:
+        best = min(timeit.repeat(function, number=args.number, repeat=5))
+        print(f"{name:<20} {best / args.number * 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Finds the submod count above which decode_attestation_result's process pool
+# beats the sequential from_data() + validate() path.
+#
+# The pool is created once and reused, as a long-running service would.
+#
+#   python -m benchmarks.parallel_decode [--workers N] [--sizes N ...]
+import argparse
+import os
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from benchmarks.payloads import payload
+from src.parallel import decode_attestation_result
+
+
+def best_time(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel submod decode crossover")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--sizes", type=int, nargs="*", default=[16, 64, 256, 1024, 4096, 16384]
+    )
+    args = parser.parse_args()
+
+    print(f"workers: {args.workers}")
+    print(
+        f"{'submods':>8} {'sequential (ms)':>16} {'parallel (ms)':>14} {'speedup':>8}"
+    )
+    crossover = None
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        decode_attestation_result(payload(1), executor=executor, threshold=0)  # warm up
+        for size in args.sizes:
+            data = payload(size)
+            number = max(1, 2000 // size)
+            sequential = best_time(
+                partial(decode_attestation_result, data, threshold=size + 1), number
+            )
+            parallel = best_time(
+                partial(
+                    decode_attestation_result,
+                    data,
+                    executor=executor,
+                    threshold=0,
+                    max_workers=args.workers,
+                ),
+                number,
+            )
+            if crossover is None and parallel < sequential:
+                crossover = size
+            print(
+                f"{size:>8} {sequential * 1000:>16.2f} {parallel * 1000:>14.2f} "
+                f"{sequential / parallel:>7.2f}x"
+            )
+    print(f"crossover: {crossover or 'not reached'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# Synthetic AttestationResults shared by the benchmarks
+from src.claims import AttestationResult
+from src.submod import Submod
+from src.trust_claims import TrustClaim
+from src.trust_tier import TRUST_TIER_AFFIRMING
+from src.trust_vector import TrustVector
+from src.verifier_id import VerifierID
+
+
+def sample_submod() -> Submod:
+    return Submod(
+        trust_vector=TrustVector(*(TrustClaim(2) for _ in range(8))),
+        status=TRUST_TIER_AFFIRMING,
+    )
+
+
+def sample_result(submods: int) -> AttestationResult:
+    # An affirming result with `submods` identical, fully populated submods
+    return AttestationResult(
+        profile="tag:github.com,2023:veraison/ear",
+        issued_at=1700000000,
+        verifier_id=VerifierID(developer="Acme Inc.", build="v1.2.3"),
+        submods={f"component-{n}": sample_submod() for n in range(submods)},
+    )
+
+
+def payload(submods: int):
+    # The str-key claims-set of sample_result(submods)
+    return sample_result(submods).to_dict()
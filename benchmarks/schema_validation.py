@@ -0,0 +1,58 @@
+# Compares the compiled schema validator with building the objects and
+# calling validate(), for valid and for invalid payloads.
+#
+#   python -m benchmarks.schema_validation [--submods N]
+import argparse
+import timeit
+from functools import partial
+
+from benchmarks.payloads import payload
+from src.claims import AttestationResult
+from src.errors import EARValidationError
+from src.schema import compile_validator
+
+
+def via_objects(data):
+    try:
+        AttestationResult.from_dict(data).validate()
+    except EARValidationError:
+        pass
+
+
+def via_validator(validate, data):
+    try:
+        validate(data)
+    except EARValidationError:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compiled schema validation")
+    parser.add_argument("--submods", type=int, default=8)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    validate = compile_validator()
+    valid = payload(args.submods)
+    invalid = payload(args.submods)
+    last = list(invalid["submods"].values())[-1]
+    last["ear.trustworthiness-vector"]["hardware"] = 1000
+
+    print(f"{'payload':<8} {'objects (us)':>13} {'validator (us)':>15} {'speedup':>8}")
+    for name, data in (("valid", valid), ("invalid", invalid)):
+        objects = min(
+            timeit.repeat(partial(via_objects, data), number=args.number, repeat=3)
+        )
+        compiled = min(
+            timeit.repeat(
+                partial(via_validator, validate, data), number=args.number, repeat=3
+            )
+        )
+        print(
+            f"{name:<8} {objects / args.number * 1e6:>13.1f} "
+            f"{compiled / args.number * 1e6:>15.1f} {objects / compiled:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
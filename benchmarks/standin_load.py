@@ -0,0 +1,58 @@
+# Load-tests EAR issuance and verification over HTTP against the stand-in
+# verifier in src/standin.py, reporting latency percentiles and throughput.
+# Without --port, a stand-in is started in this process on a free port.
+#
+#   python -m benchmarks.standin_load [--port N] [--requests N] [--concurrency N]
+import argparse
+import asyncio
+
+from benchmarks.payloads import payload
+from src.replay import ReplayDetector
+from src.standin import StandinVerifier, run_load
+
+
+def verdict(submods: int):
+    return {"submods": payload(submods)["submods"]}
+
+
+async def load(args):
+    if args.port:
+        return await run_load(
+            args.host, args.port, verdict(args.submods), args.requests, args.concurrency
+        )
+    verifier = StandinVerifier(args.secret_key, replay_detector=ReplayDetector())
+    server = await verifier.start(args.host)
+    async with server:
+        return await run_load(
+            args.host,
+            server.sockets[0].getsockname()[1],
+            verdict(args.submods),
+            args.requests,
+            args.concurrency,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in verifier load test")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--secret-key", default="secret")
+    parser.add_argument("--submods", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    reports = asyncio.run(load(args))
+    print(
+        f"{'endpoint':<8} {'req/s':>8} {'p50 ms':>7} {'p90 ms':>7} {'p99 ms':>7} errors"
+    )
+    for name, report in reports.items():
+        print(
+            f"{name:<8} {report.throughput:>8.0f} "
+            + " ".join(f"{report.percentile(p) * 1e3:>7.2f}" for p in (50, 90, 99))
+            + f" {report.errors:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,72 @@
 import json
 from abc import ABC
 from collections import namedtuple
-from typing import Any, ClassVar, Dict, Tuple, Type, TypeVar, Union, get_args
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+)
 
 T = TypeVar("T", bound="BaseJCSerializable")
 
 KeyMapping = namedtuple("KeyMapping", ["int_key", "str_key"])
 
+# wire key -> (attribute, decoder) for one class and key mode
+DecodePlan = Dict[Union[str, int], Tuple[str, Callable[[Any], Any]]]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@dataclass(frozen=True)
+class ExtensionClaim:
+    # A claim outside the jc_map, e.g. a vendor extension. Once registered,
+    # its value is decoded with `decode` and kept in `extensions[name]`, and
+    # encoded back with `encode` under the key of the requested key mode.
+    name: str
+    int_key: int
+    str_key: str
+    decode: Callable[[Any], Any] = _identity
+    encode: Callable[[Any], Any] = _identity
+
+
+class ExtensionRegistry:
+    def __init__(self) -> None:
+        self._by_name: Dict[str, ExtensionClaim] = {}
+        self._by_key: Dict[bool, Dict[Union[str, int], ExtensionClaim]] = {
+            False: {},
+            True: {},
+        }
+
+    def register(self, claim: ExtensionClaim):
+        if claim.name in self._by_name:
+            raise ValueError(f"Extension {claim.name} is already registered")
+        if claim.int_key in self._by_key[True] or claim.str_key in self._by_key[False]:
+            raise ValueError(f"Keys of extension {claim.name} are already registered")
+        self._by_name[claim.name] = claim
+        self._by_key[True][claim.int_key] = claim
+        self._by_key[False][claim.str_key] = claim
+
+    def unregister(self, name: str):
+        claim = self._by_name.pop(name)
+        del self._by_key[True][claim.int_key]
+        del self._by_key[False][claim.str_key]
+
+    def by_key(self, key: Any, keys_as_int: bool) -> Optional[ExtensionClaim]:
+        return self._by_key[keys_as_int].get(key)
+
+    def by_name(self, name: Any) -> Optional[ExtensionClaim]:
+        return self._by_name.get(name)
+
 
 def to_data(value: Any, keys_as_int=False) -> Any:
     if hasattr(value, "to_data"):
@@ -26,54 +86,174 @@ def to_data(value: Any, keys_as_int=False) -> Any:
     return value
 
 
-class BaseJCSerializable(ABC):
-    jc_map: ClassVar[Dict[str, Tuple[int, str]]]
+def _field_decoder(field_type: Any, keys_as_int: bool) -> Callable[[Any], Any]:
+    args = get_args(field_type)
 
-    def to_data(self, keys_as_int=False) -> Dict[Union[str, int], Any]:
-        return {
-            (int_key if keys_as_int else str_key): to_data(
-                getattr(self, attr), keys_as_int
+    if hasattr(field_type, "from_data"):
+        # Direct object
+        def decode_object(value):
+            return field_type.from_data(value, keys_as_int=keys_as_int)
+
+        return decode_object
+
+    if hasattr(field_type, "items") and hasattr(args[1], "from_data"):
+        # Dict[str | int, CustomClass]
+        value_type = args[1]
+
+        def decode_dict(value):
+            return {
+                k: value_type.from_data(v, keys_as_int=keys_as_int)
+                for k, v in value.items()
+            }
+
+        return decode_dict
+
+    if args:
+        # custom classes that dont have 'from_data'
+        decode = args[0]
+        if type(None) not in args:
+            return decode
+
+        # Optional[...]: an explicit null stays None
+        def decode_optional(value):
+            return None if value is None else decode(value)
+
+        return decode_optional
+
+    return field_type
+
+
+_decode_plans: Dict[Tuple[type, bool], DecodePlan] = {}
+
+
+def _decode_plan(cls: type, keys_as_int: bool) -> DecodePlan:
+    # The reflection on jc_map and the type annotations is done once per class
+    # and key mode, rather than for every field of every from_data() call
+    plan = _decode_plans.get((cls, keys_as_int))
+    if plan is None:
+        annotations = getattr(cls, "__annotations__", {})
+        plan = {
+            mapping[0 if keys_as_int else 1]: (
+                attr,
+                _field_decoder(annotations[attr], keys_as_int),
             )
-            for attr, (int_key, str_key) in self.jc_map.items()
+            for attr, mapping in cls.jc_map.items()  # type: ignore[attr-defined]
+            if annotations.get(attr) is not None
         }
+        _decode_plans[(cls, keys_as_int)] = plan
+    return plan
 
-    @classmethod
-    def from_data(cls: Type[T], data: dict, keys_as_int=False) -> T:
-        key_attr = "int_key" if keys_as_int else "str_key"
-        init_kwargs = {}
-        reverse_map = {
-            getattr(mapping, key_attr): attr for attr, mapping in cls.jc_map.items()
-        }
 
-        for key, value in data.items():
-            if key not in reverse_map:
-                continue
+def to_data_pair(value: Any) -> Tuple[Any, Any]:
+    # Builds the str-key and the int-key layout of value in a single walk.
+    # Only BaseJCSerializable objects differ between the two; everything else
+    # is converted once and shared by both layouts.
+    if hasattr(value, "to_data_pair"):
+        return value.to_data_pair()
+    if hasattr(value, "items"):  # dict-like
+        str_items, int_items = {}, {}
+        shared = True
+        for key, item in value.items():
+            key = to_data(key)
+            str_value, int_value = to_data_pair(item)
+            str_items[key] = str_value
+            int_items[key] = int_value
+            shared = shared and str_value is int_value
+        return (str_items, str_items) if shared else (str_items, int_items)
+    if hasattr(value, "__iter__") and not isinstance(value, str):  # list-like
+        pairs = [to_data_pair(v) for v in value]
+        str_list = [str_value for str_value, _ in pairs]
+        if all(str_value is int_value for str_value, int_value in pairs):
+            return str_list, str_list
+        return str_list, [int_value for _, int_value in pairs]
+    data = to_data(value)
+    return data, data
 
-            attr = reverse_map[key]
-            field_type = getattr(cls, "__annotations__", {}).get(attr)
-            if field_type is None:
-                continue
 
-            args = get_args(field_type)
+class BaseJCSerializable(ABC):
+    jc_map: ClassVar[Dict[str, Tuple[int, str]]]
+
+    # Classes that set a registry (and declare `extensions` and
+    # `unknown_claims` dict fields) keep claims that are not in their jc_map
+    # instead of dropping them: registered claims decoded in `extensions`, by
+    # name, and any other claim as received in `unknown_claims`, by wire key.
+    # The two are kept apart so that an unknown claim is never mistaken for
+    # a registered one whose name happens to equal its key.
+    extension_registry: ClassVar[Optional[ExtensionRegistry]] = None
+    extensions: Dict[str, Any]
+    unknown_claims: Dict[Union[str, int], Any]
 
-            if hasattr(field_type, "from_data"):
-                # Direct object
-                init_kwargs[attr] = field_type.from_data(value, keys_as_int=keys_as_int)
+    def to_data(self, keys_as_int=False) -> Dict[Union[str, int], Any]:
+        data: Dict[Union[str, int], Any] = {}
+        for attr, (int_key, str_key) in self.jc_map.items():
+            value = getattr(self, attr)
+            if value is None:
+                continue  # unset optional claims are omitted
+            data[int_key if keys_as_int else str_key] = to_data(value, keys_as_int)
+        if self.extension_registry is not None:
+            data.update(self._extensions_to_data(keys_as_int))
+        return data
+
+    def to_data_pair(self) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
+        # (to_data(), to_data(keys_as_int=True)) in a single walk
+        str_data: Dict[Any, Any] = {}
+        int_data: Dict[Any, Any] = {}
+        for attr, (int_key, str_key) in self.jc_map.items():
+            value = getattr(self, attr)
+            if value is None:
+                continue  # unset optional claims are omitted
+            str_data[str_key], int_data[int_key] = to_data_pair(value)
+        if self.extension_registry is not None:
+            str_data.update(self._extensions_to_data(keys_as_int=False))
+            int_data.update(self._extensions_to_data(keys_as_int=True))
+        return str_data, int_data
 
-            elif hasattr(field_type, "items") and hasattr(args[1], "from_data"):
-                # Dict[str | int, CustomClass]
-                init_kwargs[attr] = {
-                    k: args[1].from_data(v, keys_as_int=keys_as_int)
-                    for k, v in value.items()
-                }
+    def _extensions_to_data(self, keys_as_int: bool) -> Dict[Union[str, int], Any]:
+        # unknown claims go back under the key they were received with
+        data: Dict[Union[str, int], Any] = dict(self.unknown_claims)
+        for name, value in self.extensions.items():
+            claim = self.extension_registry.by_name(name)  # type: ignore[union-attr]
+            if claim is None:
+                raise ValueError(f"Extension {name} is not registered")
+            key = claim.int_key if keys_as_int else claim.str_key
+            data[key] = claim.encode(value)
+        return data
 
-            elif args:
-                # custom classes that dont have 'from_data'
-                init_kwargs[attr] = args[0](value)
+    @classmethod
+    def register_extension(cls, claim: ExtensionClaim):
+        if cls.extension_registry is None:
+            raise TypeError(f"{cls.__name__} does not support extension claims")
+        for int_key, str_key in cls.jc_map.values():
+            if claim.int_key == int_key or claim.str_key == str_key:
+                raise ValueError(
+                    f"Keys of extension {claim.name} are claims of {cls.__name__}"
+                )
+        cls.extension_registry.register(claim)
 
-            else:
-                init_kwargs[attr] = field_type(value)
+    @classmethod
+    def from_data(cls: Type[T], data: dict, keys_as_int=False) -> T:
+        plan = _decode_plan(cls, keys_as_int)
+        registry = cls.extension_registry
+        init_kwargs = {}
+        extensions: Dict[str, Any] = {}
+        unknown_claims: Dict[Union[str, int], Any] = {}
+
+        for key, value in data.items():
+            entry = plan.get(key)
+            if entry is not None:
+                attr, decode = entry
+                init_kwargs[attr] = decode(value)
+            elif registry is not None:
+                claim = registry.by_key(key, keys_as_int)
+                if claim is None:
+                    unknown_claims[key] = value
+                else:
+                    extensions[claim.name] = claim.decode(value)
 
+        if extensions:
+            init_kwargs["extensions"] = extensions
+        if unknown_claims:
+            init_kwargs["unknown_claims"] = unknown_claims
         return cls(**init_kwargs)
 
     def to_dict(self) -> Dict[str, Any]:
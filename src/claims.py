@@ -1,15 +1,120 @@
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
-from jose import jwt  # type: ignore # pylint: disable=import-error
-
-from src.base import BaseJCSerializable, KeyMapping
+from src.base import BaseJCSerializable, ExtensionRegistry, KeyMapping
+from src.clock import CWT_TIME_KEYS, DEFAULT_CLOCK, Clock, check_time_claims
 from src.errors import EARValidationError
-from src.jwt_config import DEFAULT_ALGORITHM, DEFAULT_EXPIRATION_MINUTES
+from src.jws import unverified_jwt_segments
+from src.jwt_config import (
+    DEFAULT_ALGORITHM,
+    DEFAULT_EXPIRATION_MINUTES,
+    DEFAULT_LEEWAY_SECONDS,
+)
 from src.submod import Submod
 from src.verifier_id import VerifierID
 
+if TYPE_CHECKING:
+    from src.replay import ReplayDetector
+
+
+def _jwt():
+    # python-jose loads its crypto backends on import, which dominates the
+    # import time of this module, so it is only pulled in once a token is
+    # actually encoded or decoded
+    # pylint: disable-next=import-error,import-outside-toplevel
+    from jose import jwt  # type: ignore
+
+    return jwt
+
+
+def _cbor2():
+    # imported on first use, like python-jose
+    import cbor2  # pylint: disable=import-outside-toplevel,import-error
+
+    return cbor2
+
+
+def _cose():
+    # src.cose loads hashlib and hmac, which only CWTs need
+    from src import cose  # pylint: disable=import-outside-toplevel
+
+    return cose
+
+
+# Claims that belong to the token rather than to the AttestationResult
+_JWT_TOKEN_CLAIMS = ("exp", "nbf")
+_CWT_EXP, _, _CWT_NBF = CWT_TIME_KEYS
+_CWT_TOKEN_CLAIMS = (_CWT_EXP, _CWT_NBF)
+
+# Time claims are checked by check_time_claims() against an injectable clock
+# before the signature is verified, so python-jose does not repeat them
+_JOSE_OPTIONS = {"verify_exp": False, "verify_nbf": False, "verify_iat": False}
+
+
+def verify_jwt(
+    token: str,
+    secret_key: str,
+    algorithm: str = DEFAULT_ALGORITHM,
+    clock: Optional[Clock] = None,
+    leeway: int = DEFAULT_LEEWAY_SECONDS,
+) -> Dict[str, Any]:
+    # Verifies a JWT and returns its claims-set without building any objects.
+    # exp/iat/nbf are checked first, straight from the payload segment, so
+    # expired or not-yet-valid tokens never reach signature verification
+    try:
+        now = (clock or DEFAULT_CLOCK).now()
+        _, claims = unverified_jwt_segments(token)
+        check_time_claims(claims, now, leeway)
+        return _jwt().decode(
+            token, secret_key, algorithms=[algorithm], options=_JOSE_OPTIONS
+        )
+    except Exception as exc:
+        raise ValueError(f"JWT decoding failed: {exc}") from exc
+
+
+def sign_jwt(
+    claims: Dict[str, Any],
+    secret_key: str,
+    algorithm: str = DEFAULT_ALGORITHM,
+    headers: Optional[Dict[str, Any]] = None,
+) -> str:
+    # Signs a str-key claims-set as a JWT, with extra protected headers
+    # (e.g. a "kid") if given
+    return _jwt().encode(
+        claims, secret_key, algorithm=algorithm, headers=headers
+    )  # pyright: ignore[reportGeneralTypeIssues]
+
+
+def sign_cwt(
+    claims: Dict[Any, Any], secret_key: str, algorithm: str = DEFAULT_ALGORITHM
+) -> bytes:
+    # MACs an int-key claims-set as a CWT (COSE_Mac0 with the HMAC matching
+    # the JOSE algorithm name, e.g. HS256 -> HMAC 256/256)
+    return _cose().mac0_encode(_cbor2().dumps(claims), secret_key.encode(), algorithm)
+
+
+def verify_cwt(
+    token: bytes,
+    secret_key: str,
+    algorithm: str = DEFAULT_ALGORITHM,
+    clock: Optional[Clock] = None,
+    leeway: int = DEFAULT_LEEWAY_SECONDS,
+) -> Dict[Any, Any]:
+    # Verifies a CWT and returns its int-key claims-set without building any
+    # objects. As with JWTs, the time claims are checked before the MAC.
+    try:
+        cose = _cose()
+        protected, payload, tag = cose.mac0_payload(token)
+        claims = _cbor2().loads(payload)
+        if not isinstance(claims, dict):
+            raise ValueError("token payload must be a CBOR map")
+        now = (clock or DEFAULT_CLOCK).now()
+        check_time_claims(claims, now, leeway, keys=CWT_TIME_KEYS)
+        cose.mac0_verify(protected, payload, tag, secret_key.encode(), algorithm)
+        return claims
+    except Exception as exc:
+        raise ValueError(f"CWT decoding failed: {exc}") from exc
+
 
 # https://datatracker.ietf.org/doc/draft-fv-rats-ear/
 @dataclass
@@ -18,6 +123,10 @@ class AttestationResult(BaseJCSerializable):
     issued_at: int
     verifier_id: VerifierID
     submods: Dict[str, Submod] = field(default_factory=dict)
+    nonce: Optional[str] = None
+    # claims outside jc_map, see BaseJCSerializable.extension_registry
+    extensions: Dict[str, Any] = field(default_factory=dict)
+    unknown_claims: Dict[Union[str, int], Any] = field(default_factory=dict)
 
     # https://www.ietf.org/archive/id/draft-ietf-rats-eat-31.html#section-7.2.4
     jc_map = {
@@ -25,7 +134,9 @@ class AttestationResult(BaseJCSerializable):
         "issued_at": KeyMapping(6, "iat"),
         "verifier_id": KeyMapping(1004, "ear.verifier-id"),
         "submods": KeyMapping(266, "submods"),
+        "nonce": KeyMapping(10, "eat_nonce"),
     }
+    extension_registry = ExtensionRegistry()
 
     def validate(self):
         # Validates an AttestationResult object
@@ -38,6 +149,13 @@ class AttestationResult(BaseJCSerializable):
                 "AttestationResult issued_at must be a positive integer"
             )
 
+        if self.nonce is not None and (
+            not isinstance(self.nonce, str) or not self.nonce
+        ):
+            raise EARValidationError(
+                "AttestationResult nonce must be a non-empty string"
+            )
+
         self.verifier_id.validate()
 
         for submod, details in self.submods.items():
@@ -46,31 +164,86 @@ class AttestationResult(BaseJCSerializable):
                     f"Submodule {submod} must contain a valid trust_vector and status"
                 )
 
-            trust_vector = details.trust_vector
-            trust_vector.validate()
+            details.validate()
 
     def encode_jwt(
         self,
         secret_key: str,
         algorithm: str = DEFAULT_ALGORITHM,
         expiration_minutes: int = DEFAULT_EXPIRATION_MINUTES,
+        clock: Optional[Clock] = None,
     ) -> str:
         # Signs an AttestationResult object and returns a JWT
         payload = self.to_dict()
-        payload["exp"] = int(
-            datetime.timestamp(datetime.now() + timedelta(minutes=expiration_minutes))
-        )
-        return jwt.encode(
-            payload, secret_key, algorithm=algorithm
-        )  # pyright: ignore[reportGeneralTypeIssues]
+        payload["exp"] = (clock or DEFAULT_CLOCK).now() + expiration_minutes * 60
+        return sign_jwt(payload, secret_key, algorithm)
+
+    def encode_cwt(
+        self,
+        secret_key: str,
+        algorithm: str = DEFAULT_ALGORITHM,
+        expiration_minutes: int = DEFAULT_EXPIRATION_MINUTES,
+        clock: Optional[Clock] = None,
+    ) -> bytes:
+        # MACs an AttestationResult object and returns a CWT
+        payload = self.to_int_keys()
+        payload[_CWT_EXP] = (clock or DEFAULT_CLOCK).now() + expiration_minutes * 60
+        return sign_cwt(payload, secret_key, algorithm)
+
+    @classmethod
+    def decode_cwt(  # pylint: disable=too-many-arguments
+        cls,
+        token: bytes,
+        secret_key: str,
+        algorithm: str = DEFAULT_ALGORITHM,
+        clock: Optional[Clock] = None,
+        leeway: int = DEFAULT_LEEWAY_SECONDS,
+    ):
+        # Verifies a CWT and returns the decoded AttestationResult object.
+        payload = verify_cwt(token, secret_key, algorithm, clock, leeway)
+        for claim in _CWT_TOKEN_CLAIMS:
+            payload.pop(claim, None)
+        try:
+            return cls.from_int_keys(payload)
+        except Exception as exc:
+            raise ValueError(f"CWT decoding failed: {exc}") from exc
 
     @classmethod
-    def decode_jwt(
-        cls, token: str, secret_key: str, algorithm: str = DEFAULT_ALGORITHM
+    def decode_jwt(  # pylint: disable=too-many-arguments
+        cls,
+        token: str,
+        secret_key: str,
+        algorithm: str = DEFAULT_ALGORITHM,
+        clock: Optional[Clock] = None,
+        leeway: int = DEFAULT_LEEWAY_SECONDS,
+        replay_detector: Optional["ReplayDetector"] = None,
     ):
         # Verifies a JWT and returns the decoded AttestationResult object.
+        # With a replay_detector, the token must carry a nonce and an exp, and
+        # is rejected if its nonce has been seen before.
+        payload = verify_jwt(token, secret_key, algorithm, clock, leeway)
+        return cls.from_jwt_claims(payload, leeway, replay_detector)
+
+    @classmethod
+    def from_jwt_claims(
+        cls,
+        payload: Dict[str, Any],
+        leeway: int = DEFAULT_LEEWAY_SECONDS,
+        replay_detector: Optional["ReplayDetector"] = None,
+    ):
+        # Decodes the claims-set of a JWT whose signature and time claims have
+        # already been verified, as decode_jwt() does for any verifier of it
+        exp = payload.get("exp")
+        for claim in _JWT_TOKEN_CLAIMS:
+            payload.pop(claim, None)
         try:
-            payload = jwt.decode(token, secret_key, algorithms=[algorithm])
-            return cls.from_dict(payload)
+            result = cls.from_dict(payload)
         except Exception as exc:
             raise ValueError(f"JWT decoding failed: {exc}") from exc
+
+        if replay_detector is not None:
+            if result.nonce is None or exp is None:
+                raise ValueError("JWT decoding failed: token has no nonce or exp")
+            if not replay_detector.check_result(result, exp, leeway):
+                raise ValueError("JWT decoding failed: token has been replayed")
+        return result
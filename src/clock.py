@@ -0,0 +1,73 @@
+import time
+from typing import Any, Mapping, Optional, Protocol, Tuple
+
+
+class Clock(Protocol):  # pylint: disable=too-few-public-methods
+    # Source of the current time in whole seconds since the epoch (UTC)
+    def now(self) -> int: ...
+
+
+class SystemClock:  # pylint: disable=too-few-public-methods
+    # Reads the wall clock on every call
+    def now(self) -> int:
+        return int(time.time())
+
+
+class MonotonicClock:  # pylint: disable=too-few-public-methods
+    # Anchors the wall clock once and advances it with time.monotonic(), so
+    # it is immune to wall clock adjustments made after the clock was
+    # created. The monotonic clock stops during system suspend and ignores
+    # NTP steps, so a long-lived MonotonicClock drifts behind wall time;
+    # it is opt-in only, for short-lived processes such as benchmarks.
+    def __init__(self):
+        self._offset = time.time() - time.monotonic()
+
+    def now(self) -> int:
+        return int(self._offset + time.monotonic())
+
+
+class FixedClock:  # pylint: disable=too-few-public-methods
+    # Always returns the same instant; useful in tests and for replaying
+    # stored tokens as of a given time
+    def __init__(self, timestamp: int):
+        self.timestamp = timestamp
+
+    def now(self) -> int:
+        return self.timestamp
+
+
+DEFAULT_CLOCK: Clock = SystemClock()
+
+# Keys of the (exp, iat, nbf) claims in JWT and CWT claims-sets
+JWT_TIME_KEYS: Tuple[Any, Any, Any] = ("exp", "iat", "nbf")
+CWT_TIME_KEYS: Tuple[Any, Any, Any] = (4, 6, 5)
+
+
+def check_time_claims(
+    claims: Mapping[Any, Any],
+    now: int,
+    leeway: int = 0,
+    keys: Tuple[Any, Any, Any] = JWT_TIME_KEYS,
+):
+    # Rejects claims that are expired or not yet valid at `now`, allowing
+    # for `leeway` seconds of clock skew. Missing claims are not checked.
+    # As in python-jose, an iat in the future is allowed: only nbf makes a
+    # token not yet valid, so a relying party whose clock lags the verifier's
+    # still accepts fresh tokens. Times are NumericDates (RFC 7519), so
+    # non-integer values are accepted.
+    exp_key, _, nbf_key = keys
+    for key in keys:
+        value = claims.get(key)
+        if value is not None and not _is_numeric_date(value):
+            raise ValueError(f"{key} must be a number")
+
+    exp: Optional[Any] = claims.get(exp_key)
+    if exp is not None and exp <= now - leeway:
+        raise ValueError("token has expired")
+    nbf: Optional[Any] = claims.get(nbf_key)
+    if nbf is not None and nbf > now + leeway:
+        raise ValueError(f"token is not yet valid ({nbf_key} is in the future)")
+
+
+def _is_numeric_date(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
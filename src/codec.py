@@ -0,0 +1,143 @@
+import json
+import re
+from typing import Dict, Iterable, List, Optional, Union
+
+from src.claims import AttestationResult, sign_cwt, sign_jwt
+from src.clock import CWT_TIME_KEYS, DEFAULT_CLOCK, JWT_TIME_KEYS, Clock
+from src.cose import COSE_MAC0_TAG, CWT_TAG
+from src.jwt_config import (
+    DEFAULT_ALGORITHM,
+    DEFAULT_EXPIRATION_MINUTES,
+    DEFAULT_LEEWAY_SECONDS,
+)
+
+# Serialisations of an AttestationResult: plain JSON (str keys), plain CBOR
+# (int keys), and their signed/MACed forms, JWT and CWT
+JSON = "json"
+JWT = "jwt"
+CBOR = "cbor"
+CWT = "cwt"
+FORMATS = (JSON, JWT, CBOR, CWT)
+# Formats whose integrity is protected, and that decode() accepts by default
+SIGNED_FORMATS = (JWT, CWT)
+
+_JWT_PATTERN = re.compile(r"^[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]*$")
+
+Encoded = Union[str, bytes]
+
+_JWT_EXP = JWT_TIME_KEYS[0]
+_CWT_EXP = CWT_TIME_KEYS[0]
+
+
+def _cbor2():
+    import cbor2  # pylint: disable=import-outside-toplevel,import-error
+
+    return cbor2
+
+
+def _check_formats(formats: Iterable[str]) -> List[str]:
+    formats = list(dict.fromkeys(formats))
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown formats: {sorted(unknown)}")
+    return formats
+
+
+def encode(  # pylint: disable=too-many-arguments
+    result: AttestationResult,
+    formats: Iterable[str] = FORMATS,
+    secret_key: Optional[str] = None,
+    algorithm: str = DEFAULT_ALGORITHM,
+    expiration_minutes: int = DEFAULT_EXPIRATION_MINUTES,
+    clock: Optional[Clock] = None,
+) -> Dict[str, Encoded]:
+    # Encodes result in every requested format, converting it to claims-sets
+    # only once: both layouts come out of a single to_data_pair() walk, and the
+    # JWT and CWT share the same exp. secret_key is needed for JWT and CWT.
+    formats = _check_formats(formats)
+    if secret_key is None and (JWT in formats or CWT in formats):
+        raise ValueError("secret_key is required for JWT and CWT")
+
+    key = secret_key or ""
+    str_data, int_data = result.to_data_pair()
+    exp = (clock or DEFAULT_CLOCK).now() + expiration_minutes * 60
+
+    encoded: Dict[str, Encoded] = {}
+    for name in formats:
+        if name == JSON:
+            encoded[name] = json.dumps(str_data)
+        elif name == JWT:
+            encoded[name] = sign_jwt({**str_data, _JWT_EXP: exp}, key, algorithm)
+        elif name == CBOR:
+            encoded[name] = _cbor2().dumps(int_data)
+        else:
+            encoded[name] = sign_cwt({**int_data, _CWT_EXP: exp}, key, algorithm)
+    return encoded
+
+
+def _as_bytes(data: Encoded) -> bytes:
+    return data.encode() if isinstance(data, str) else bytes(data)
+
+
+def _as_text(data: Encoded) -> str:
+    return data if isinstance(data, str) else bytes(data).decode()
+
+
+def sniff_format(data: Encoded) -> str:
+    # Tells which of FORMATS data is in, without decoding it
+    if not isinstance(data, str):
+        head = bytes(data[:2])
+        if head[:1] == bytes([0xC0 | COSE_MAC0_TAG]) or head == bytes([0xD8, CWT_TAG]):
+            return CWT
+        if head and head[0] >> 5 == 5:  # CBOR major type 5: map
+            return CBOR
+    try:
+        text = _as_text(data).strip()
+    except UnicodeDecodeError as exc:
+        raise ValueError("Unrecognised EAR format") from exc
+
+    if text.startswith("{"):
+        return JSON
+    if _JWT_PATTERN.match(text):
+        return JWT
+    raise ValueError("Unrecognised EAR format")
+
+
+def decode(  # pylint: disable=too-many-arguments
+    data: Encoded,
+    secret_key: Optional[str] = None,
+    algorithm: str = DEFAULT_ALGORITHM,
+    clock: Optional[Clock] = None,
+    leeway: int = DEFAULT_LEEWAY_SECONDS,
+    formats: Iterable[str] = SIGNED_FORMATS,
+) -> AttestationResult:
+    # Decodes an EAR in one of `formats`, detected with sniff_format().
+    # JWTs and CWTs are verified, and need secret_key. Plain JSON and CBOR
+    # carry no signature, so they are only accepted when listed in `formats`
+    # and no secret_key is given: a caller holding a key expects a verified
+    # EAR, and must not be handed a forged claims-set instead.
+    kind = sniff_format(data)
+    if kind not in _check_formats(formats):
+        raise ValueError(f"{kind.upper()} EARs are not accepted")
+    if kind in SIGNED_FORMATS:
+        if secret_key is None:
+            raise ValueError(f"secret_key is required to decode a {kind.upper()}")
+    elif secret_key is not None:
+        raise ValueError(f"{kind.upper()} EARs are unsigned and cannot be verified")
+    key = secret_key or ""
+
+    if kind == CWT:
+        return AttestationResult.decode_cwt(
+            _as_bytes(data), key, algorithm, clock, leeway
+        )
+    if kind in (CBOR, JSON):
+        # wrapped like the failures of decode_cwt() and decode_jwt()
+        try:
+            if kind == CBOR:
+                return AttestationResult.from_int_keys(_cbor2().loads(_as_bytes(data)))
+            return AttestationResult.from_json(_as_text(data))
+        except Exception as exc:
+            raise ValueError(f"{kind.upper()} decoding failed: {exc}") from exc
+    return AttestationResult.decode_jwt(
+        _as_text(data).strip(), key, algorithm, clock, leeway
+    )
@@ -0,0 +1,69 @@
+import hashlib
+import hmac
+from typing import Any, Callable, Dict, Tuple
+
+# COSE_Mac0 (RFC 9052, section 6.2) with the HMAC algorithms of RFC 9053,
+# keyed by the JOSE algorithm names used for JWTs
+COSE_MAC_ALGORITHMS: Dict[str, Tuple[int, Callable[..., Any]]] = {
+    "HS256": (5, hashlib.sha256),  # HMAC 256/256
+    "HS384": (6, hashlib.sha384),  # HMAC 384/384
+    "HS512": (7, hashlib.sha512),  # HMAC 512/512
+}
+
+COSE_MAC0_TAG = 17
+CWT_TAG = 61
+HEADER_ALG = 1
+
+
+def _cbor2():
+    import cbor2  # pylint: disable=import-outside-toplevel,import-error
+
+    return cbor2
+
+
+def _algorithm(algorithm: str) -> Tuple[int, Callable[..., Any]]:
+    if algorithm not in COSE_MAC_ALGORITHMS:
+        raise ValueError(f"Unsupported COSE MAC algorithm {algorithm}")
+    return COSE_MAC_ALGORITHMS[algorithm]
+
+
+def _mac(key: bytes, digest: Callable[..., Any], protected: bytes, payload: bytes):
+    structure = _cbor2().dumps(["MAC0", protected, b"", payload])
+    return hmac.new(key, structure, digest).digest()
+
+
+def mac0_encode(payload: bytes, key: bytes, algorithm: str) -> bytes:
+    # Wraps payload in a CWT-tagged COSE_Mac0 message
+    cbor2 = _cbor2()
+    alg, digest = _algorithm(algorithm)
+    protected = cbor2.dumps({HEADER_ALG: alg})
+    message = [protected, {}, payload, _mac(key, digest, protected, payload)]
+    return cbor2.dumps(cbor2.CBORTag(CWT_TAG, cbor2.CBORTag(COSE_MAC0_TAG, message)))
+
+
+def mac0_payload(token: bytes) -> Tuple[bytes, bytes, bytes]:
+    # Splits a (CWT-tagged) COSE_Mac0 message into its protected header,
+    # payload and tag, WITHOUT checking the tag
+    cbor2 = _cbor2()
+    message = cbor2.loads(token)
+    if isinstance(message, cbor2.CBORTag) and message.tag == CWT_TAG:
+        message = message.value
+    if not isinstance(message, cbor2.CBORTag) or message.tag != COSE_MAC0_TAG:
+        raise ValueError("token is not a COSE_Mac0 message")
+    message = message.value
+    if not isinstance(message, list) or len(message) != 4:
+        raise ValueError("malformed COSE_Mac0 message")
+    protected, _, payload, tag = message
+    return protected, payload, tag
+
+
+def mac0_verify(
+    protected: bytes, payload: bytes, tag: bytes, key: bytes, algorithm: str
+):
+    # Checks the algorithm and the tag of a COSE_Mac0 message
+    alg, digest = _algorithm(algorithm)
+    header = _cbor2().loads(protected) if protected else {}
+    if header.get(HEADER_ALG) != alg:
+        raise ValueError("The specified alg value is not allowed")
+    if not hmac.compare_digest(_mac(key, digest, protected, payload), tag):
+        raise ValueError("Signature verification failed")
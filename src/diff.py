@@ -0,0 +1,173 @@
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from src.claims import AttestationResult
+from src.submod import Submod
+from src.trust_tier import INT_TO_TRUST_TIER, TrustTier, claim_tier
+from src.trust_vector import TrustVector
+
+# Changes in posture are computed on compact forms rather than on nested
+# dicts: a TrustVector becomes a tuple of claim values (None when unset) in
+# jc_map order, a Submod a (status value, vector) pair, and an
+# AttestationResult a dict of compact submods. Equal submods are then
+# skipped with a single tuple comparison.
+CompactVector = Tuple[Optional[int], ...]
+CompactSubmod = Tuple[int, CompactVector]
+CompactResult = Dict[str, CompactSubmod]
+
+TRUST_VECTOR_CATEGORIES: Tuple[str, ...] = tuple(TrustVector.jc_map)
+
+
+def compact_trust_vector(vector: TrustVector) -> CompactVector:
+    return tuple(
+        None if claim is None else claim.value
+        for claim in (getattr(vector, name) for name in TRUST_VECTOR_CATEGORIES)
+    )
+
+
+def compact_submod(submod: Submod) -> CompactSubmod:
+    return submod.status.value, compact_trust_vector(submod.trust_vector)
+
+
+def compact_result(result: AttestationResult) -> CompactResult:
+    return {name: compact_submod(submod) for name, submod in result.submods.items()}
+
+
+def _tier(value: Optional[int]) -> Optional[TrustTier]:
+    return None if value is None else claim_tier(value)
+
+
+def _status(value: Optional[int]) -> Optional[TrustTier]:
+    return None if value is None else INT_TO_TRUST_TIER.get(value, TrustTier(value))
+
+
+@dataclass(frozen=True)
+class ClaimChange:
+    submod: Optional[str]
+    category: str
+    old: Optional[int]
+    new: Optional[int]
+    old_tier: Optional[TrustTier]
+    new_tier: Optional[TrustTier]
+
+    @property
+    def tier_changed(self) -> bool:
+        return self.old_tier != self.new_tier
+
+
+@dataclass(frozen=True)
+class StatusChange:
+    submod: Optional[str]
+    old: Optional[TrustTier]
+    new: Optional[TrustTier]
+
+
+@dataclass
+class AttestationDiff:
+    # Claim changes are also reported for added or removed submods, against
+    # unset claims
+    added_submods: List[str] = field(default_factory=list)
+    removed_submods: List[str] = field(default_factory=list)
+    status_changes: List[StatusChange] = field(default_factory=list)
+    claim_changes: List[ClaimChange] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.added_submods
+            or self.removed_submods
+            or self.status_changes
+            or self.claim_changes
+        )
+
+    @property
+    def tier_changes(self) -> List[ClaimChange]:
+        return [change for change in self.claim_changes if change.tier_changed]
+
+
+_UNSET_VECTOR: CompactVector = (None,) * len(TRUST_VECTOR_CATEGORIES)
+
+
+def _diff_vectors(
+    old: CompactVector, new: CompactVector, submod: Optional[str]
+) -> List[ClaimChange]:
+    return [
+        ClaimChange(
+            submod, category, old_value, new_value, _tier(old_value), _tier(new_value)
+        )
+        for category, old_value, new_value in zip(TRUST_VECTOR_CATEGORIES, old, new)
+        if old_value != new_value
+    ]
+
+
+def _diff_submod(
+    diff: AttestationDiff,
+    old: Optional[CompactSubmod],
+    new: Optional[CompactSubmod],
+    name: Optional[str],
+):
+    if old == new:
+        return
+    old_status, old_vector = old if old is not None else (None, _UNSET_VECTOR)
+    new_status, new_vector = new if new is not None else (None, _UNSET_VECTOR)
+    if old_status != new_status:
+        diff.status_changes.append(
+            StatusChange(name, _status(old_status), _status(new_status))
+        )
+    diff.claim_changes.extend(_diff_vectors(old_vector, new_vector, name))
+
+
+def diff_compact(old: CompactResult, new: CompactResult) -> AttestationDiff:
+    diff = AttestationDiff()
+    for name, submod in new.items():
+        previous = old.get(name)
+        if previous is None:
+            diff.added_submods.append(name)
+        _diff_submod(diff, previous, submod, name)
+    for name, submod in old.items():
+        if name not in new:
+            diff.removed_submods.append(name)
+            _diff_submod(diff, submod, None, name)
+    return diff
+
+
+def diff_results(old: AttestationResult, new: AttestationResult) -> AttestationDiff:
+    return diff_compact(compact_result(old), compact_result(new))
+
+
+def diff_submods(
+    old: Submod, new: Submod, name: Optional[str] = None
+) -> AttestationDiff:
+    diff = AttestationDiff()
+    _diff_submod(diff, compact_submod(old), compact_submod(new), name)
+    return diff
+
+
+def diff_trust_vectors(
+    old: TrustVector, new: TrustVector, submod: Optional[str] = None
+) -> List[ClaimChange]:
+    return _diff_vectors(compact_trust_vector(old), compact_trust_vector(new), submod)
+
+
+class ChangeTracker:
+    # Keeps the compact form of the last result of every attester and reports
+    # what changed when a new one arrives
+    def __init__(self) -> None:
+        self._last: Dict[Hashable, CompactResult] = {}
+
+    def __len__(self) -> int:
+        return len(self._last)
+
+    def update(
+        self, attester: Hashable, result: AttestationResult
+    ) -> Optional[AttestationDiff]:
+        # Returns the changes since the previous result of attester, or None
+        # if there are none or this is its first result
+        current = compact_result(result)
+        previous = self._last.get(attester)
+        self._last[attester] = current
+        if previous is None or previous == current:
+            return None
+        return diff_compact(previous, current)
+
+    def forget(self, attester: Hashable):
+        self._last.pop(attester, None)
@@ -0,0 +1,198 @@
+import mmap
+import os
+import struct
+from typing import Iterator, Tuple
+
+import cbor2  # pylint: disable=import-error
+
+from src.claims import AttestationResult
+
+# Append-only binary log of AttestationResults.
+#
+# The log file starts with LOG_MAGIC and holds one record per result: a
+# little-endian uint32 length followed by the CBOR encoding of to_int_keys().
+# The sidecar index (<log>.idx) starts with INDEX_MAGIC and a uint64 flags
+# word, followed by one fixed-size INDEX_ENTRY per record, so that the n-th
+# record is found without reading the log itself.
+LOG_MAGIC = b"EARLOG\x00\x01"
+INDEX_MAGIC = b"EARIDX\x00\x01"
+INDEX_SUFFIX = ".idx"
+
+RECORD_HEADER = struct.Struct("<I")  # record length
+INDEX_HEADER = struct.Struct("<8sQ")  # magic, flags
+INDEX_ENTRY = struct.Struct("<QIq")  # record offset, record length, issued_at
+
+# Set while entries have been appended in non-decreasing issued_at order,
+# which lets range lookups binary search the index
+FLAG_SORTED = 1
+
+
+def _open_file(path: str, magic: bytes, header: bytes):
+    # Opens `path` for appending, creating it with `header` if needed
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        with open(path, "wb") as new_file:
+            new_file.write(header)
+    file = open(path, "r+b")  # pylint: disable=consider-using-with
+    if file.read(len(magic)) != magic:
+        file.close()
+        raise ValueError(f"{path} is not an EAR log file")
+    return file
+
+
+class EARLogWriter:
+    def __init__(self, path: str):
+        self.path = path
+        self._log = _open_file(path, LOG_MAGIC, LOG_MAGIC)
+        try:
+            self._index = _open_file(
+                path + INDEX_SUFFIX,
+                INDEX_MAGIC,
+                INDEX_HEADER.pack(INDEX_MAGIC, FLAG_SORTED),
+            )
+        except ValueError:
+            self._log.close()
+            raise
+
+        self._index.seek(0)
+        _, self._flags = INDEX_HEADER.unpack(self._index.read(INDEX_HEADER.size))
+        size = self._index.seek(0, os.SEEK_END)
+        self._count = (size - INDEX_HEADER.size) // INDEX_ENTRY.size
+        self._last_issued_at = None
+        self._offset = len(LOG_MAGIC)
+        if self._count:
+            self._index.seek(INDEX_HEADER.size + (self._count - 1) * INDEX_ENTRY.size)
+            offset, length, self._last_issued_at = INDEX_ENTRY.unpack(
+                self._index.read(INDEX_ENTRY.size)
+            )
+            self._offset = offset + length
+        # A crash mid-append can leave part of an index entry, or a record
+        # that was never indexed; drop them so that new entries line up
+        self._index.truncate(INDEX_HEADER.size + self._count * INDEX_ENTRY.size)
+        self._index.seek(0, os.SEEK_END)
+        self._log.truncate(self._offset)
+        self._log.seek(self._offset)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, result: AttestationResult) -> int:
+        # Appends a result and returns its sequence number
+        record = cbor2.dumps(result.to_int_keys())
+        self._log.write(RECORD_HEADER.pack(len(record)))
+        self._log.write(record)
+
+        if (
+            self._flags & FLAG_SORTED
+            and self._last_issued_at is not None
+            and result.issued_at < self._last_issued_at
+        ):
+            self._flags &= ~FLAG_SORTED
+            self._index.seek(0)
+            self._index.write(INDEX_HEADER.pack(INDEX_MAGIC, self._flags))
+            self._index.seek(0, os.SEEK_END)
+        self._index.write(
+            INDEX_ENTRY.pack(
+                self._offset + RECORD_HEADER.size, len(record), result.issued_at
+            )
+        )
+
+        self._offset += RECORD_HEADER.size + len(record)
+        self._last_issued_at = result.issued_at
+        self._count += 1
+        return self._count - 1
+
+    def flush(self):
+        self._log.flush()
+        self._index.flush()
+
+    def close(self):
+        self.flush()
+        self._log.close()
+        self._index.close()
+
+    def __enter__(self) -> "EARLogWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class EARLog:
+    # Read-only view of an EAR log through mmap; only the records that are
+    # looked up are decoded. The view covers the log as it was when opened.
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as log_file:
+            self._log = mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ)
+        with open(path + INDEX_SUFFIX, "rb") as index_file:
+            self._index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self._flags = INDEX_HEADER.unpack_from(self._index)
+        if self._log[: len(LOG_MAGIC)] != LOG_MAGIC or magic != INDEX_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an EAR log file")
+        self._count = (len(self._index) - INDEX_HEADER.size) // INDEX_ENTRY.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, seq: int) -> Tuple[int, int, int]:
+        # (record offset, record length, issued_at) of a record
+        offset, length, issued_at = INDEX_ENTRY.unpack_from(
+            self._index, INDEX_HEADER.size + seq * INDEX_ENTRY.size
+        )
+        return offset, length, issued_at
+
+    def _record(self, offset: int, length: int) -> AttestationResult:
+        end = offset + length
+        return AttestationResult.from_int_keys(cbor2.loads(self._log[offset:end]))
+
+    def _check_seq(self, seq: int) -> int:
+        # Normalises a negative sequence number, as for a list
+        if seq < 0:
+            seq += self._count
+        if not 0 <= seq < self._count:
+            raise IndexError("EARLog index out of range")
+        return seq
+
+    def __getitem__(self, seq: int) -> AttestationResult:
+        offset, length, _ = self._entry(self._check_seq(seq))
+        return self._record(offset, length)
+
+    def issued_at(self, seq: int) -> int:
+        # issued_at of a record, read from the index only
+        return self._entry(self._check_seq(seq))[2]
+
+    def _first_at_or_after(self, issued_at: int) -> int:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._entry(middle)[2] < issued_at:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def range_issued_at(
+        self, start: int, end: int
+    ) -> Iterator[Tuple[int, AttestationResult]]:
+        # Yields (sequence number, result) for records with
+        # start <= issued_at < end, in log order
+        if self._flags & FLAG_SORTED:
+            seqs = range(self._first_at_or_after(start), self._first_at_or_after(end))
+        else:
+            seqs = range(self._count)
+        for seq in seqs:
+            offset, length, issued_at = self._entry(seq)
+            if start <= issued_at < end:
+                yield seq, self._record(offset, length)
+
+    def close(self):
+        self._log.close()
+        self._index.close()
+
+    def __enter__(self) -> "EARLog":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,199 @@
+import random
+import string
+from typing import Any, Callable, Dict, Tuple, Type
+
+import cbor2  # pylint: disable=import-error
+
+from src.base import BaseJCSerializable
+from src.claims import AttestationResult
+from src.submod import Submod
+from src.trust_claims import TrustClaim
+from src.trust_tier import INT_TO_TRUST_TIER, TRUST_TIER_TO_STRING
+from src.trust_vector import TrustVector
+from src.verifier_id import VerifierID
+
+# Random AttestationResults for round-trip fuzzing and load generation.
+#
+# Valid results only carry what survives serialisation: trust claims hold a
+# value only, as their tag and descriptions are never transported.
+
+FUZZ_SECRET_KEY = "fuzz-secret-key"
+
+# Upper bound of the generated iat, so that tokens are never issued in the
+# future of the clock that decodes them
+MAX_ISSUED_AT = 1_700_000_000
+
+_ALPHABET = string.ascii_letters + string.digits + "-_.:/ éü€"
+
+Mutation = Callable[[Dict[Any, Any], bool], None]
+
+
+def _text(rng: random.Random, max_length: int = 24) -> str:
+    return "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(1, max_length)))
+
+
+def random_trust_vector(rng: random.Random) -> TrustVector:
+    return TrustVector(
+        **{
+            name: TrustClaim(rng.randint(-128, 127))
+            for name in TrustVector.jc_map
+            if rng.random() < 0.7
+        }
+    )
+
+
+def random_submod(rng: random.Random) -> Submod:
+    return Submod(
+        trust_vector=random_trust_vector(rng),
+        status=rng.choice(list(INT_TO_TRUST_TIER.values())),
+    )
+
+
+def random_attestation_result(
+    rng: random.Random, max_submods: int = 8
+) -> AttestationResult:
+    return AttestationResult(
+        profile=_text(rng),
+        issued_at=rng.randint(1, MAX_ISSUED_AT),
+        verifier_id=VerifierID(developer=_text(rng), build=_text(rng)),
+        submods={
+            _text(rng): random_submod(rng) for _ in range(rng.randint(0, max_submods))
+        },
+        nonce=_text(rng, 64) if rng.random() < 0.5 else None,
+    )
+
+
+def _key(cls: Type[BaseJCSerializable], attr: str, keys_as_int: bool) -> Any:
+    return cls.jc_map[attr][0 if keys_as_int else 1]
+
+
+def _first_submod(data: Dict[Any, Any], keys_as_int: bool) -> Dict[Any, Any]:
+    submods = data[_key(AttestationResult, "submods", keys_as_int)]
+    return next(iter(submods.values()))
+
+
+def _first_vector(data: Dict[Any, Any], keys_as_int: bool) -> Dict[Any, Any]:
+    submod = _first_submod(data, keys_as_int)
+    return submod[_key(Submod, "trust_vector", keys_as_int)]
+
+
+def _status_as_name(data: Dict[Any, Any], keys_as_int: bool):
+    submod = _first_submod(data, keys_as_int)
+    key = _key(Submod, "status", keys_as_int)
+    submod[key] = TRUST_TIER_TO_STRING[INT_TO_TRUST_TIER[submod[key]]]
+
+
+def _null_claim(data: Dict[Any, Any], keys_as_int: bool):
+    vector = _first_vector(data, keys_as_int)
+    key = _key(TrustVector, "hardware", keys_as_int)
+    if key not in vector:
+        vector[key] = None
+
+
+def _set(value: Any, *path: Tuple[Type[BaseJCSerializable], str]) -> Mutation:
+    # Sets the claim at path (a chain of (class, attribute) pairs)
+    def mutate(data: Dict[Any, Any], keys_as_int: bool):
+        *parents, (cls, attr) = path
+        for parent_cls, parent_attr in parents:
+            data = data[_key(parent_cls, parent_attr, keys_as_int)]
+        data[_key(cls, attr, keys_as_int)] = value
+
+    return mutate
+
+
+def _set_claim(value: Any) -> Mutation:
+    def mutate(data: Dict[Any, Any], keys_as_int: bool):
+        _first_vector(data, keys_as_int)[
+            _key(TrustVector, "executables", keys_as_int)
+        ] = value
+
+    return mutate
+
+
+def _set_status(value: Any) -> Mutation:
+    def mutate(data: Dict[Any, Any], keys_as_int: bool):
+        _first_submod(data, keys_as_int)[_key(Submod, "status", keys_as_int)] = value
+
+    return mutate
+
+
+# Rewrites of a valid claims-set that must decode to the same result
+EQUIVALENT_MUTATIONS: Dict[str, Mutation] = {
+    "status as tier name": _status_as_name,
+    "explicit null claim": _null_claim,
+}
+
+# Corruptions of a valid claims-set that validate() must reject
+INVALID_MUTATIONS: Dict[str, Mutation] = {
+    "empty profile": _set("", (AttestationResult, "profile")),
+    "zero iat": _set(0, (AttestationResult, "issued_at")),
+    "negative iat": _set(-1, (AttestationResult, "issued_at")),
+    "empty nonce": _set("", (AttestationResult, "nonce")),
+    "empty developer": _set(
+        "", (AttestationResult, "verifier_id"), (VerifierID, "developer")
+    ),
+    "empty build": _set("", (AttestationResult, "verifier_id"), (VerifierID, "build")),
+    "claim too large": _set_claim(128),
+    "claim too small": _set_claim(-129),
+    "unknown status": _set_status(7),
+    "unknown tier name": _set_status("trusted"),
+}
+
+
+def _with_submod(rng: random.Random) -> AttestationResult:
+    result = random_attestation_result(rng)
+    if not result.submods:
+        result.submods[_text(rng)] = random_submod(rng)
+    return result
+
+
+def random_equivalent_data(
+    rng: random.Random, keys_as_int: bool = False
+) -> Tuple[str, AttestationResult, Dict[Any, Any]]:
+    # A result, and a claims-set that is encoded differently from
+    # result.to_data() but must decode to the same result
+    result = _with_submod(rng)
+    data = result.to_data(keys_as_int=keys_as_int)
+    name = rng.choice(sorted(EQUIVALENT_MUTATIONS))
+    EQUIVALENT_MUTATIONS[name](data, keys_as_int)
+    return name, result, data
+
+
+def random_invalid_data(
+    rng: random.Random, keys_as_int: bool = False
+) -> Tuple[str, Dict[Any, Any]]:
+    # A claims-set with one invalid claim, and the name of the mutation
+    result = _with_submod(rng)
+    data = result.to_data(keys_as_int=keys_as_int)
+    name = rng.choice(sorted(INVALID_MUTATIONS))
+    INVALID_MUTATIONS[name](data, keys_as_int)
+    return name, data
+
+
+def _decode_jwt(token: str) -> AttestationResult:
+    return AttestationResult.decode_jwt(token, FUZZ_SECRET_KEY)
+
+
+def _decode_cwt(token: bytes) -> AttestationResult:
+    return AttestationResult.decode_cwt(token, FUZZ_SECRET_KEY)
+
+
+# name -> (encoder, decoder) of every serialisation path
+CODECS: Dict[
+    str, Tuple[Callable[[AttestationResult], Any], Callable[[Any], AttestationResult]]
+] = {
+    "dict": (AttestationResult.to_dict, AttestationResult.from_dict),
+    "int-keys": (AttestationResult.to_int_keys, AttestationResult.from_int_keys),
+    "json": (AttestationResult.to_json, AttestationResult.from_json),
+    "cbor": (
+        lambda result: cbor2.dumps(result.to_int_keys()),
+        lambda data: AttestationResult.from_int_keys(cbor2.loads(data)),
+    ),
+    "jwt": (lambda result: result.encode_jwt(FUZZ_SECRET_KEY), _decode_jwt),
+    "cwt": (lambda result: result.encode_cwt(FUZZ_SECRET_KEY), _decode_cwt),
+}
+
+
+def roundtrip(result: AttestationResult, codec: str) -> AttestationResult:
+    encoder, decoder = CODECS[codec]
+    return decoder(encoder(result))
@@ -0,0 +1,113 @@
+from typing import Any, Dict, List, Optional
+
+from src.claims import AttestationResult
+
+# A patch turns one int-key claims-set into the next one. It is a map with up
+# to three entries, each omitted when empty:
+#   PATCH_SET: {key: value} for added or replaced values
+#   PATCH_DELETE: [key, ...] for removed keys
+#   PATCH_NESTED: {key: patch} for maps that changed in place
+Patch = Dict[int, Any]
+
+PATCH_SET = 0
+PATCH_DELETE = 1
+PATCH_NESTED = 2
+
+DEFAULT_KEYFRAME_INTERVAL = 32
+
+
+def diff_data(old: Dict[Any, Any], new: Dict[Any, Any]) -> Patch:
+    # Computes the patch that turns `old` into `new`
+    set_values = {}
+    nested = {}
+    for key, value in new.items():
+        if key not in old:
+            set_values[key] = value
+            continue
+        previous = old[key]
+        if previous == value:
+            continue
+        if isinstance(previous, dict) and isinstance(value, dict):
+            nested[key] = diff_data(previous, value)
+        else:
+            set_values[key] = value
+
+    patch: Patch = {}
+    if set_values:
+        patch[PATCH_SET] = set_values
+    deleted = [key for key in old if key not in new]
+    if deleted:
+        patch[PATCH_DELETE] = deleted
+    if nested:
+        patch[PATCH_NESTED] = nested
+    return patch
+
+
+def apply_patch(old: Dict[Any, Any], patch: Patch) -> Dict[Any, Any]:
+    # Returns a new map with `patch` applied; `old` is left untouched, and maps
+    # the patch does not touch are shared with it
+    new = dict(old)
+    for key in patch.get(PATCH_DELETE, ()):
+        del new[key]
+    new.update(patch.get(PATCH_SET, {}))
+    for key, nested in patch.get(PATCH_NESTED, {}).items():
+        new[key] = apply_patch(old[key], nested)
+    return new
+
+
+class EARHistory:
+    # Compact, append-only history of the AttestationResults of one attester.
+    #
+    # Consecutive EARs usually differ in a handful of claims, so every result
+    # is stored as a patch against its predecessor over the int-key
+    # representation (see to_int_keys). A full claims-set (keyframe) is kept
+    # every `keyframe_interval` entries, so any version is rebuilt from at
+    # most `keyframe_interval - 1` patches.
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be a positive integer")
+        self.keyframe_interval = keyframe_interval
+        self._entries: List[Dict[Any, Any]] = []
+        self._last: Optional[Dict[Any, Any]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def append(self, result: AttestationResult):
+        data = result.to_int_keys()
+        if self._last is None or len(self._entries) % self.keyframe_interval == 0:
+            self._entries.append(data)
+        else:
+            self._entries.append(diff_data(self._last, data))
+        self._last = data
+
+    def __getitem__(self, index: int) -> AttestationResult:
+        return AttestationResult.from_int_keys(self._data(index))
+
+    def _data(self, index: int) -> Dict[Any, Any]:
+        if index < 0:
+            index += len(self._entries)
+        if not 0 <= index < len(self._entries):
+            raise IndexError("EARHistory index out of range")
+
+        keyframe = index - index % self.keyframe_interval
+        data = self._entries[keyframe]
+        for position in range(keyframe + 1, index + 1):
+            data = apply_patch(data, self._entries[position])
+        return data
+
+    def to_bytes(self) -> bytes:
+        import cbor2  # pylint: disable=import-outside-toplevel,import-error
+
+        return cbor2.dumps([self.keyframe_interval, self._entries])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "EARHistory":
+        import cbor2  # pylint: disable=import-outside-toplevel,import-error
+
+        keyframe_interval, entries = cbor2.loads(data)
+        history = cls(keyframe_interval)
+        history._entries = entries
+        if entries:
+            history._last = history._data(-1)
+        return history
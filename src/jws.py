@@ -0,0 +1,28 @@
+import base64
+import json
+from typing import Any, Dict, Tuple
+
+
+def b64url_decode(segment: str) -> bytes:
+    # base64url decoding of a JWS segment, whose padding is stripped
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def b64url_encode(data: bytes) -> str:
+    # base64url encoding of a JWS segment, with the padding stripped
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64_json(segment: str) -> Any:
+    return json.loads(b64url_decode(segment))
+
+
+def unverified_jwt_segments(token: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    # Decodes the header and payload of a compact JWS without verifying it
+    parts = token.split(".")
+    if len(parts) != 3:
+        raise ValueError("token must have three segments")
+    header, claims = _b64_json(parts[0]), _b64_json(parts[1])
+    if not isinstance(header, dict) or not isinstance(claims, dict):
+        raise ValueError("token header and payload must be JSON objects")
+    return header, claims
@@ -1,10 +1,22 @@
-import secrets
-
 # Default cryptographic settings for JWT
 DEFAULT_ALGORITHM = "HS256"
 DEFAULT_EXPIRATION_MINUTES = 60
+# Allowed clock skew, in seconds, when checking exp/iat/nbf
+DEFAULT_LEEWAY_SECONDS = 0
 
 
 def generate_secret_key() -> str:
-    # Generates a secure random secret key for JWT signing.
+    # Generates a secure random secret key for JWT signing, or a master
+    # secret for src.keys.KeyRing, which derives and rotates per-epoch keys.
+    # secrets (and the hmac/random modules behind it) is imported here so that
+    # importing the default settings stays cheap
+    import secrets  # pylint: disable=import-outside-toplevel
+
     return secrets.token_hex(32)
+
+
+def generate_nonce() -> str:
+    # Generates a random verifier nonce for AttestationResult.nonce
+    import secrets  # pylint: disable=import-outside-toplevel
+
+    return secrets.token_urlsafe(32)
@@ -0,0 +1,157 @@
+import hashlib
+import hmac
+import json
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
+
+from src.claims import AttestationResult
+from src.clock import DEFAULT_CLOCK, Clock, check_time_claims
+from src.jws import b64url_decode, b64url_encode, unverified_jwt_segments
+from src.jwt_config import (
+    DEFAULT_ALGORITHM,
+    DEFAULT_EXPIRATION_MINUTES,
+    DEFAULT_LEEWAY_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from src.replay import ReplayDetector
+
+# Per-epoch JWT signing keys derived from one master secret.
+#
+# A token carries the epoch it was signed in as its "kid" header, so the
+# verifier picks the one key that can have signed it instead of trying every
+# key it has rotated through.
+
+HMAC_DIGESTS: Dict[str, Callable[..., Any]] = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+DEFAULT_EPOCH_SECONDS = 24 * 60 * 60
+DEFAULT_KEY_WINDOW = 2
+
+
+def hkdf_sha256(ikm: bytes, info: bytes, length: int = 32, salt: bytes = b"") -> bytes:
+    # HKDF (RFC 5869) with SHA-256
+    prk = hmac.new(salt or bytes(32), ikm, hashlib.sha256).digest()
+    okm = block = b""
+    counter = 1
+    while len(okm) < length:
+        block = hmac.new(prk, block + info + bytes([counter]), hashlib.sha256).digest()
+        okm += block
+        counter += 1
+    return okm[:length]
+
+
+class KeyRing:
+    # Signs with the key of the current epoch and verifies against the keys
+    # of the last `window` epochs. The HMAC state of each active key is keyed
+    # once and copied per token, so rotations cost nothing at verification.
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        master_secret: Union[str, bytes],
+        epoch_seconds: int = DEFAULT_EPOCH_SECONDS,
+        window: int = DEFAULT_KEY_WINDOW,
+        algorithm: str = DEFAULT_ALGORITHM,
+        clock: Optional[Clock] = None,
+    ) -> None:
+        if algorithm not in HMAC_DIGESTS:
+            raise ValueError(f"unsupported algorithm: {algorithm}")
+        if epoch_seconds <= 0 or window <= 0:
+            raise ValueError("epoch_seconds and window must be positive")
+        if isinstance(master_secret, str):
+            master_secret = master_secret.encode()
+        self._master_secret = master_secret
+        self.epoch_seconds = epoch_seconds
+        self.window = window
+        self.algorithm = algorithm
+        self.clock = clock or DEFAULT_CLOCK
+        self._macs: Dict[int, Any] = {}
+        self._current: Optional[int] = None
+
+    def epoch(self, now: Optional[int] = None) -> int:
+        if now is None:
+            now = self.clock.now()
+        return now // self.epoch_seconds
+
+    def key(self, epoch: int) -> bytes:
+        # The secret key of an epoch; usable with sign_jwt()/verify_jwt() too
+        info = f"python-ear {self.algorithm} epoch {epoch}".encode()
+        return hkdf_sha256(
+            self._master_secret, info, HMAC_DIGESTS[self.algorithm]().digest_size
+        )
+
+    def _mac(self, epoch: int, current: int, newest: Optional[int] = None) -> Any:
+        # Copy of the keyed HMAC state of an active epoch. Retired epochs are
+        # evicted whenever the current epoch moves on. The newest epoch let
+        # through defaults to the current one; a verifier whose clock lags
+        # the signer's by up to its leeway allows the next one too.
+        if current != self._current:
+            self._current = current
+            for retired in [e for e in self._macs if e <= current - self.window]:
+                del self._macs[retired]
+        if newest is None:
+            newest = current
+        if not current - self.window < epoch <= newest:
+            raise ValueError(f"key epoch {epoch} is not active")
+        mac = self._macs.get(epoch)
+        if mac is None:
+            mac = hmac.new(self.key(epoch), digestmod=HMAC_DIGESTS[self.algorithm])
+            self._macs[epoch] = mac
+        return mac.copy()
+
+    def sign(self, claims: Dict[str, Any]) -> str:
+        # Signs a str-key claims-set as a JWT with the current epoch's key
+        current = self.epoch()
+        header = {"alg": self.algorithm, "kid": str(current), "typ": "JWT"}
+        signing_input = ".".join(
+            b64url_encode(json.dumps(part, separators=(",", ":")).encode())
+            for part in (header, claims)
+        )
+        mac = self._mac(current, current)
+        mac.update(signing_input.encode("ascii"))
+        return f"{signing_input}.{b64url_encode(mac.digest())}"
+
+    def verify(
+        self, token: str, leeway: int = DEFAULT_LEEWAY_SECONDS
+    ) -> Dict[str, Any]:
+        # Verifies a JWT signed by sign() with one HMAC, whatever the number of
+        # rotations, and returns its claims-set. Like verify_jwt(), the time
+        # claims are checked before the signature.
+        try:
+            now = self.clock.now()
+            header, claims = unverified_jwt_segments(token)
+            check_time_claims(claims, now, leeway)
+            if header.get("alg") != self.algorithm:
+                raise ValueError(f"unexpected algorithm: {header.get('alg')}")
+            if "kid" not in header:
+                raise ValueError("token has no kid header")
+            mac = self._mac(
+                int(header["kid"]), self.epoch(now), self.epoch(now + leeway)
+            )
+            signing_input, _, signature = token.rpartition(".")
+            mac.update(signing_input.encode("ascii"))
+            if not hmac.compare_digest(mac.digest(), b64url_decode(signature)):
+                raise ValueError("signature verification failed")
+        except Exception as exc:
+            raise ValueError(f"JWT decoding failed: {exc}") from exc
+        return claims
+
+    def encode_jwt(
+        self,
+        result: AttestationResult,
+        expiration_minutes: int = DEFAULT_EXPIRATION_MINUTES,
+    ) -> str:
+        payload = result.to_dict()
+        payload["exp"] = self.clock.now() + expiration_minutes * 60
+        return self.sign(payload)
+
+    def decode_jwt(
+        self,
+        token: str,
+        leeway: int = DEFAULT_LEEWAY_SECONDS,
+        replay_detector: Optional["ReplayDetector"] = None,
+    ) -> AttestationResult:
+        # Like AttestationResult.decode_jwt(), with the key picked by epoch
+        payload = self.verify(token, leeway)
+        return AttestationResult.from_jwt_claims(payload, leeway, replay_detector)
@@ -0,0 +1,85 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import replace
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.claims import AttestationResult
+from src.submod import Submod
+
+# Below this many submods the cost of shipping them to worker processes
+# outweighs the decoding work (see benchmarks/parallel_decode.py)
+DEFAULT_PARALLEL_THRESHOLD = 512
+
+# Chunks handed out per worker, to even out uneven submods
+CHUNKS_PER_WORKER = 4
+
+
+def _decode_submods(
+    items: Sequence[Tuple[str, Dict[Any, Any]]], keys_as_int: bool, validate: bool
+) -> List[Tuple[str, Submod]]:
+    # Runs in the worker: decodes (and validates) one chunk of submods
+    submods = []
+    for name, data in items:
+        submod = Submod.from_data(data, keys_as_int=keys_as_int)
+        if validate:
+            submod.validate()
+        submods.append((name, submod))
+    return submods
+
+
+def _chunks(items: List[Any], count: int) -> List[List[Any]]:
+    # Splits items into at most `count` chunks of similar size
+    size = max(1, -(-len(items) // count))  # ceiling division
+    iterator = iter(items)
+    chunks = []
+    while chunk := list(islice(iterator, size)):
+        chunks.append(chunk)
+    return chunks
+
+
+def decode_attestation_result(  # pylint: disable=too-many-arguments
+    data: Dict[Any, Any],
+    keys_as_int: bool = False,
+    validate: bool = True,
+    executor: Optional[Executor] = None,
+    threshold: int = DEFAULT_PARALLEL_THRESHOLD,
+    max_workers: Optional[int] = None,
+) -> AttestationResult:
+    # Decodes (and by default validates) an AttestationResult, spreading the
+    # submods over a pool of workers when there are at least `threshold` of
+    # them. The result is the same as from_data() followed by validate().
+    #
+    # Pass a long-lived `executor` when decoding many payloads, as starting a
+    # process pool costs far more than decoding a single one.
+    submods_key = AttestationResult.jc_map["submods"][0 if keys_as_int else 1]
+    submods = data.get(submods_key) or {}
+    if len(submods) < threshold:
+        result = AttestationResult.from_data(data, keys_as_int=keys_as_int)
+        if validate:
+            result.validate()
+        return result
+
+    header = {key: value for key, value in data.items() if key != submods_key}
+    result = AttestationResult.from_data(header, keys_as_int=keys_as_int)
+    if validate:
+        result.validate()  # submods are validated by the workers
+
+    workers = max_workers or os.cpu_count() or 1
+    chunks = _chunks(list(submods.items()), workers * CHUNKS_PER_WORKER)
+    own_executor = executor is None
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        decoded = pool.map(
+            _decode_submods,
+            chunks,
+            [keys_as_int] * len(chunks),
+            [validate] * len(chunks),
+        )
+        return replace(
+            result,
+            submods={name: submod for chunk in decoded for name, submod in chunk},
+        )
+    finally:
+        if own_executor:
+            pool.shutdown()
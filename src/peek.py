@@ -0,0 +1,122 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
+
+from src.claims import AttestationResult
+from src.jws import unverified_jwt_segments
+from src.verifier_id import VerifierID
+
+# CBOR tags of a CWT and of the signed or MACed COSE structures it may wrap
+# (COSE_Sign1, COSE_Mac0, COSE_Mac, COSE_Sign). COSE_Encrypt0 and
+# COSE_Encrypt carry ciphertext, not claims, so they cannot be peeked at.
+# https://www.rfc-editor.org/rfc/rfc8392#section-6
+CWT_TAG = 61
+COSE_TAGS = {17, 18, 97, 98}
+
+# Claim keys that are not part of the AttestationResult jc_map
+JWT_EXP_KEY = "exp"
+CWT_EXP_KEY = 4
+
+
+@dataclass(frozen=True)
+class UntrustedClaims:
+    # Selected claims read from an EAR WITHOUT verifying its signature.
+    # They are only fit for routing and pre-filtering; anything that relies on
+    # them for a trust decision must decode the token with decode_jwt instead.
+    header: Dict[Any, Any] = field(default_factory=dict)
+    profile: Optional[str] = None
+    verifier_id: Optional[Dict[str, Any]] = None
+    issued_at: Optional[int] = None
+    expires_at: Optional[int] = None
+    submod_names: Tuple[str, ...] = ()
+
+
+@lru_cache(maxsize=None)
+def _claim_keys(keys_as_int: bool) -> Tuple[Any, Any, Any, Any, Dict[Any, str]]:
+    # (profile, issued_at, verifier_id, submods, verifier_id field names) keys,
+    # taken from the jc_maps so the peek always agrees with the full decoder
+    index = 0 if keys_as_int else 1
+    keys = AttestationResult.jc_map
+    verifier_fields = {
+        mapping[index]: mapping[1] for mapping in VerifierID.jc_map.values()
+    }
+    return (
+        keys["profile"][index],
+        keys["issued_at"][index],
+        keys["verifier_id"][index],
+        keys["submods"][index],
+        verifier_fields,
+    )
+
+
+def _select(
+    header: Dict[Any, Any], claims: Dict[Any, Any], keys_as_int: bool
+) -> UntrustedClaims:
+    profile_key, iat_key, verifier_key, submods_key, verifier_fields = _claim_keys(
+        keys_as_int
+    )
+    verifier_id = claims.get(verifier_key)
+    if isinstance(verifier_id, dict):
+        verifier_id = {
+            verifier_fields[k]: v
+            for k, v in verifier_id.items()
+            if k in verifier_fields
+        }
+    submods = claims.get(submods_key)
+    return UntrustedClaims(
+        header=header,
+        profile=claims.get(profile_key),
+        verifier_id=verifier_id,
+        issued_at=claims.get(iat_key),
+        expires_at=claims.get(CWT_EXP_KEY if keys_as_int else JWT_EXP_KEY),
+        submod_names=tuple(submods) if isinstance(submods, dict) else (),
+    )
+
+
+def peek_jwt(token: str) -> UntrustedClaims:
+    # Reads the routing claims of a JWT EAR; the signature is NOT verified
+    header, claims = unverified_jwt_segments(token)
+    return _select(header, claims, keys_as_int=False)
+
+
+def _cwt_segments(token: bytes) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
+    # Decodes the header and payload of a COSE message without verifying it
+    import cbor2  # pylint: disable=import-outside-toplevel,import-error
+
+    message = cbor2.loads(token)
+    while isinstance(message, cbor2.CBORTag):
+        if message.tag != CWT_TAG and message.tag not in COSE_TAGS:
+            raise ValueError(f"unexpected CBOR tag {message.tag}")
+        message = message.value
+    if not isinstance(message, list) or len(message) < 3:
+        raise ValueError("token is not a COSE message")
+
+    protected, unprotected, payload = message[:3]
+    header = dict(unprotected) if isinstance(unprotected, dict) else {}
+    if protected:
+        protected_header = cbor2.loads(protected)
+        if not isinstance(protected_header, dict):
+            raise ValueError("token protected header must be a CBOR map")
+        header.update(protected_header)
+    claims = cbor2.loads(payload) if payload else {}
+    if not isinstance(claims, dict):
+        raise ValueError("token payload must be a CBOR map")
+    return header, claims
+
+
+def peek_cwt(token: bytes) -> UntrustedClaims:
+    # Reads the routing claims of a CWT EAR (COSE_Sign1/COSE_Mac0, optionally
+    # wrapped in the CWT tag); the signature or MAC is NOT verified. Any
+    # malformed token raises ValueError, whatever cbor2 raised for it.
+    try:
+        header, claims = _cwt_segments(token)
+    except Exception as exc:
+        raise ValueError(f"CWT peek failed: {exc}") from exc
+    return _select(header, claims, keys_as_int=True)
+
+
+def peek(token: Union[str, bytes]) -> UntrustedClaims:
+    # Peeks at a JWT (text) or CWT (binary) EAR; the signature is NOT verified
+    if isinstance(token, str):
+        return peek_jwt(token)
+    return peek_cwt(token)
@@ -0,0 +1,86 @@
+import hashlib
+import heapq
+from typing import Dict, List, Optional, Set
+
+from src.claims import AttestationResult
+from src.clock import DEFAULT_CLOCK, Clock
+
+DEFAULT_BUCKET_SECONDS = 60
+
+
+def _fingerprint(token_id: str) -> int:
+    # 64-bit fingerprint of a nonce or token ID; with 10^7 live entries the
+    # odds of two distinct IDs colliding are below 1 in 300000
+    return int.from_bytes(
+        hashlib.blake2b(token_id.encode(), digest_size=8).digest(), "little"
+    )
+
+
+class ReplayDetector:
+    # Remembers the nonces (or other token IDs) of accepted EARs until the
+    # EARs expire, so a token presented twice is detected.
+    #
+    # Each entry is a 64-bit fingerprint held in one set of live
+    # fingerprints, so a lookup is a single hash probe however many tokens
+    # are live, exact up to fingerprint collisions. For eviction, entries are
+    # also listed in buckets of `bucket_seconds` by their exp, and a whole
+    # bucket is dropped once every token in it has expired, so the memory
+    # used tracks the tokens that are still valid.
+    def __init__(
+        self,
+        bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+        clock: Optional[Clock] = None,
+    ) -> None:
+        if bucket_seconds < 1:
+            raise ValueError("bucket_seconds must be a positive integer")
+        self.bucket_seconds = bucket_seconds
+        self.clock = clock or DEFAULT_CLOCK
+        self._seen: Set[int] = set()
+        self._buckets: Dict[int, List[int]] = {}
+        self._expiries: List[int] = []  # heap of bucket numbers
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def evict(self, now: Optional[int] = None):
+        # Drops the buckets whose tokens have all expired
+        if now is None:
+            now = self.clock.now()
+        # a bucket holds tokens with exp < (number + 1) * bucket_seconds
+        while self._expiries and (self._expiries[0] + 1) * self.bucket_seconds <= now:
+            self._seen.difference_update(
+                self._buckets.pop(heapq.heappop(self._expiries))
+            )
+
+    def check_and_record(self, token_id: str, exp: int, leeway: int = 0) -> bool:
+        # Returns True, and records token_id, if it has not been seen before.
+        # Returns False for a replay, and for tokens that expired more than
+        # `leeway` seconds ago, whose replays could no longer be detected.
+        # Pass the leeway the token's exp was checked with: the token is
+        # then remembered for as long as it would be accepted.
+        now = self.clock.now()
+        expiry = exp + leeway
+        if expiry <= now:
+            return False
+        self.evict(now)
+
+        fingerprint = _fingerprint(token_id)
+        if fingerprint in self._seen:
+            return False
+
+        number = expiry // self.bucket_seconds
+        bucket = self._buckets.get(number)
+        if bucket is None:
+            bucket = self._buckets[number] = []
+            heapq.heappush(self._expiries, number)
+        bucket.append(fingerprint)
+        self._seen.add(fingerprint)
+        return True
+
+    def check_result(
+        self, result: AttestationResult, exp: int, leeway: int = 0
+    ) -> bool:
+        # check_and_record() keyed by the nonce of an AttestationResult
+        if result.nonce is None:
+            raise ValueError("AttestationResult has no nonce")
+        return self.check_and_record(result.nonce, exp, leeway)
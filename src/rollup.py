@@ -0,0 +1,144 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from src.claims import AttestationResult, verify_jwt
+from src.clock import Clock
+from src.jwt_config import DEFAULT_ALGORITHM, DEFAULT_LEEWAY_SECONDS
+from src.submod import Submod
+from src.trust_tier import (
+    INT_TO_TRUST_TIER,
+    STRING_TO_TRUST_TIER,
+    TRUST_TIER_NONE,
+    TRUST_TIER_TO_STRING,
+    TrustTier,
+)
+from src.verifier_id import VerifierID
+
+# Every group keeps one counter per trust tier, in this order
+TIER_NAMES: Tuple[str, ...] = tuple(TRUST_TIER_TO_STRING.values())
+_TIER_SLOTS: Dict[TrustTier, int] = {
+    tier: slot for slot, tier in enumerate(TRUST_TIER_TO_STRING)
+}
+
+# Maps every accepted representation of a status (int, str or TrustTier) to
+# its counter slot; anything else counts as "none", as in to_trust_tier()
+_STATUS_SLOTS: Dict[Any, int] = {
+    **_TIER_SLOTS,
+    **{value: _TIER_SLOTS[tier] for value, tier in INT_TO_TRUST_TIER.items()},
+    **{name: _TIER_SLOTS[tier] for name, tier in STRING_TO_TRUST_TIER.items()},
+}
+_NONE_SLOT = _TIER_SLOTS[TRUST_TIER_NONE]
+
+# (profile, verifier build, submod name)
+GroupKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class RollupRow:
+    profile: str
+    build: str
+    submod: str
+    total: int
+    counts: Dict[str, int]
+    percentages: Dict[str, float]
+
+
+def _data_keys(keys_as_int: bool) -> Tuple[Any, Any, Any, Any, Any]:
+    # (profile, verifier_id, submods, build, status) keys of a raw claims-set
+    index = 0 if keys_as_int else 1
+    return (
+        AttestationResult.jc_map["profile"][index],
+        AttestationResult.jc_map["verifier_id"][index],
+        AttestationResult.jc_map["submods"][index],
+        VerifierID.jc_map["build"][index],
+        Submod.jc_map["status"][index],
+    )
+
+
+_DATA_KEYS = {False: _data_keys(False), True: _data_keys(True)}
+
+
+class TierRollup:
+    # Streaming counts of submod trust tiers per profile, verifier build and
+    # submod name.
+    #
+    # Memory grows with the number of distinct groups only, not with the
+    # number of results added. Rollups built by different workers can be
+    # combined with merge(), and pickle as plain dicts.
+    def __init__(self) -> None:
+        self._counts: Dict[GroupKey, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _count(self, profile: str, build: str, submod: str, status: Any):
+        key = (profile, build, submod)
+        counters = self._counts.get(key)
+        if counters is None:
+            counters = self._counts[key] = [0] * len(TIER_NAMES)
+        counters[_STATUS_SLOTS.get(status, _NONE_SLOT)] += 1
+
+    def add(self, result: AttestationResult):
+        build = result.verifier_id.build
+        for name, submod in result.submods.items():
+            self._count(result.profile, build, name, submod.status)
+
+    def add_data(self, data: Mapping[Any, Any], keys_as_int: bool = False):
+        # Counts a raw claims-set (e.g. from to_dict, to_int_keys or a decoded
+        # token) without building AttestationResult objects
+        profile_key, verifier_key, submods_key, build_key, status_key = _DATA_KEYS[
+            keys_as_int
+        ]
+        profile = data[profile_key]
+        build = data[verifier_key][build_key]
+        for name, submod in data.get(submods_key, {}).items():
+            self._count(profile, build, name, submod.get(status_key))
+
+    def add_jwt(  # pylint: disable=too-many-arguments
+        self,
+        token: str,
+        secret_key: str,
+        algorithm: str = DEFAULT_ALGORITHM,
+        clock: Optional[Clock] = None,
+        leeway: int = DEFAULT_LEEWAY_SECONDS,
+    ):
+        self.add_data(verify_jwt(token, secret_key, algorithm, clock, leeway))
+
+    def update(self, results: Iterable[AttestationResult]):
+        for result in results:
+            self.add(result)
+
+    def merge(self, other: "TierRollup") -> "TierRollup":
+        # Adds the counts of `other` to this rollup and returns it
+        for key, counters in other._counts.items():  # pylint: disable=protected-access
+            mine = self._counts.get(key)
+            if mine is None:
+                self._counts[key] = list(counters)
+            else:
+                for slot, count in enumerate(counters):
+                    mine[slot] += count
+        return self
+
+    def counts(self, profile: str, build: str, submod: str) -> Dict[str, int]:
+        counters = self._counts.get((profile, build, submod), [0] * len(TIER_NAMES))
+        return dict(zip(TIER_NAMES, counters))
+
+    def report(self) -> List[RollupRow]:
+        # One row per group, sorted by group key
+        rows = []
+        for (profile, build, submod), counters in sorted(self._counts.items()):
+            total = sum(counters)
+            rows.append(
+                RollupRow(
+                    profile=profile,
+                    build=build,
+                    submod=submod,
+                    total=total,
+                    counts=dict(zip(TIER_NAMES, counters)),
+                    percentages={
+                        name: 100.0 * count / total
+                        for name, count in zip(TIER_NAMES, counters)
+                    },
+                )
+            )
+        return rows
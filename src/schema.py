@@ -0,0 +1,280 @@
+import re
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, get_args
+
+from src.base import BaseJCSerializable
+from src.claims import AttestationResult
+from src.errors import EARValidationError
+from src.trust_claims import TrustClaim
+from src.trust_tier import INT_TO_TRUST_TIER, TRUST_TIER_TO_STRING, TrustTier
+
+# JSON Schema and CDDL descriptions of the wire format, generated from the
+# jc_map and type annotations of the BaseJCSerializable classes, so that
+# non-Python components can validate EARs with the exact rules used here.
+#
+# Constraints follow the validate() methods: strings must be non-empty,
+# integers positive, trust claims in [-128, 127] and statuses a known tier,
+# given as its int or, as from_data() also reads it, as its name.
+# Keys that are not in a jc_map are ignored by from_data(), so they are
+# allowed by the schemas as well, and Optional claims may be null, which
+# from_data() reads as unset.
+
+JSON_SCHEMA_DIALECT = "https://json-schema.org/draft/2020-12/schema"
+
+TRUST_CLAIM_RANGE = (-128, 127)
+TRUST_TIER_VALUES = sorted(INT_TO_TRUST_TIER)
+TRUST_TIER_NAMES = [
+    TRUST_TIER_TO_STRING[INT_TO_TRUST_TIER[value]] for value in TRUST_TIER_VALUES
+]
+
+Checker = Callable[[Any, str], None]
+
+
+def _rule_name(cls: type) -> str:
+    # AttestationResult -> attestation-result
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "-", cls.__name__).lower()
+
+
+def _unwrap(field_type: Any) -> Any:
+    # Optional[X] -> X
+    args = get_args(field_type)
+    if args and type(None) in args:
+        return args[0]
+    return field_type
+
+
+def _is_optional(field_type: Any) -> bool:
+    return type(None) in get_args(field_type)
+
+
+def _fields(cls: Type[BaseJCSerializable], keys_as_int: bool):
+    # (key, required, nullable, field type) of every mapped field of cls
+    index = 0 if keys_as_int else 1
+    annotations = getattr(cls, "__annotations__", {})
+    required = {
+        field.name
+        for field in fields(cls)  # type: ignore[arg-type]
+        if field.default is MISSING and field.default_factory is MISSING
+    }
+    return [
+        (
+            mapping[index],
+            attr in required,
+            _is_optional(annotations[attr]),
+            annotations[attr],
+        )
+        for attr, mapping in cls.jc_map.items()
+    ]
+
+
+def _json_type(field_type: Any, defs: Dict[str, Any], keys_as_int: bool) -> Any:
+    field_type = _unwrap(field_type)
+    if field_type is str:
+        return {"type": "string", "minLength": 1}
+    if field_type is int:
+        return {"type": "integer", "minimum": 1}
+    if field_type is TrustClaim:
+        low, high = TRUST_CLAIM_RANGE
+        return {"type": "integer", "minimum": low, "maximum": high}
+    if field_type is TrustTier:
+        return {"enum": TRUST_TIER_VALUES + TRUST_TIER_NAMES}
+    if hasattr(field_type, "jc_map"):
+        name = _rule_name(field_type)
+        if name not in defs:
+            defs[name] = {}  # guards against recursive definitions
+            defs[name] = _json_object(field_type, defs, keys_as_int)
+        return {"$ref": f"#/$defs/{name}"}
+    if hasattr(field_type, "items"):
+        return {
+            "type": "object",
+            "additionalProperties": _json_type(
+                get_args(field_type)[1], defs, keys_as_int
+            ),
+        }
+    raise TypeError(f"No schema for field type {field_type}")
+
+
+def _json_object(
+    cls: Type[BaseJCSerializable], defs: Dict[str, Any], keys_as_int: bool
+) -> Dict[str, Any]:
+    properties = {}
+    required = []
+    for key, is_required, nullable, field_type in _fields(cls, keys_as_int):
+        json_type = _json_type(field_type, defs, keys_as_int)
+        if nullable:
+            json_type = {"anyOf": [json_type, {"type": "null"}]}
+        properties[str(key)] = json_type
+        if is_required:
+            required.append(str(key))
+    return {"type": "object", "properties": properties, "required": required}
+
+
+def json_schema(
+    cls: Type[BaseJCSerializable] = AttestationResult, keys_as_int: bool = False
+) -> Dict[str, Any]:
+    # JSON Schema of cls; in the int-key variant the property names are the
+    # decimal string form of the int keys
+    defs: Dict[str, Any] = {}
+    schema: Dict[str, Any] = {"$schema": JSON_SCHEMA_DIALECT, "title": cls.__name__}
+    schema.update(_json_object(cls, defs, keys_as_int))
+    if defs:
+        schema["$defs"] = defs
+    return schema
+
+
+def _cddl_type(field_type: Any, rules: Dict[str, str], keys_as_int: bool) -> str:
+    field_type = _unwrap(field_type)
+    if field_type is str:
+        return "tstr .size (1..)"
+    if field_type is int:
+        return "uint .gt 0"
+    if field_type is TrustClaim:
+        rules.setdefault("trust-claim", "-128..127")
+        return "trust-claim"
+    if field_type is TrustTier:
+        rules.setdefault(
+            "trust-tier",
+            " / ".join(
+                [str(value) for value in TRUST_TIER_VALUES]
+                + [f'"{name}"' for name in TRUST_TIER_NAMES]
+            ),
+        )
+        return "trust-tier"
+    if hasattr(field_type, "jc_map"):
+        name = _rule_name(field_type)
+        if name not in rules:
+            rules[name] = ""
+            rules[name] = _cddl_map(field_type, rules, keys_as_int)
+        return name
+    if hasattr(field_type, "items"):
+        value = _cddl_type(get_args(field_type)[1], rules, keys_as_int)
+        return f"{{ * tstr => {value} }}"
+    raise TypeError(f"No CDDL for field type {field_type}")
+
+
+def _cddl_map(
+    cls: Type[BaseJCSerializable], rules: Dict[str, str], keys_as_int: bool
+) -> str:
+    # Every member is cut (^ =>, RFC 8610 section 3.5.4): a known key with a
+    # bad value fails the map instead of falling through to the wildcard
+    # that allows unknown keys.
+    members = []
+    for key, is_required, nullable, field_type in _fields(cls, keys_as_int):
+        label = str(key) if keys_as_int else f'"{key}"'
+        optional = "" if is_required else "? "
+        cddl_type = _cddl_type(field_type, rules, keys_as_int)
+        if nullable:
+            cddl_type += " / null"
+        members.append(f"  {optional}{label} ^ => {cddl_type},")
+    members.append("  * (tstr / int) => any,")
+    return "{\n" + "\n".join(members) + "\n}"
+
+
+def cddl(
+    cls: Type[BaseJCSerializable] = AttestationResult, keys_as_int: bool = False
+) -> str:
+    # CDDL (RFC 8610) rules for cls and every type it refers to, root first
+    rules: Dict[str, str] = {}
+    _cddl_type(cls, rules, keys_as_int)
+    return "\n\n".join(f"{name} = {rule}" for name, rule in rules.items()) + "\n"
+
+
+def _fail(path: str, message: str):
+    raise EARValidationError(f"{path}: {message}")
+
+
+def _check_str(value: Any, path: str):
+    if not isinstance(value, str) or not value:
+        _fail(path, "must be a non-empty string")
+
+
+def _is_int(value: Any) -> bool:
+    # JSON Schema integers do not include booleans
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _check_int(value: Any, path: str):
+    if not _is_int(value) or value <= 0:
+        _fail(path, "must be a positive integer")
+
+
+def _check_trust_claim(value: Any, path: str):
+    low, high = TRUST_CLAIM_RANGE
+    if not _is_int(value) or not low <= value <= high:
+        _fail(path, f"must be an integer in [{low}, {high}]")
+
+
+_TRUST_TIER_VALUES = frozenset(TRUST_TIER_VALUES)
+_TRUST_TIER_NAMES = frozenset(TRUST_TIER_NAMES)
+
+
+def _check_trust_tier(value: Any, path: str):
+    if isinstance(value, str):
+        if value not in _TRUST_TIER_NAMES:
+            _fail(path, f"must be one of {TRUST_TIER_NAMES}")
+    elif not _is_int(value) or value not in _TRUST_TIER_VALUES:
+        _fail(path, f"must be one of {TRUST_TIER_VALUES}")
+
+
+def _compile_type(field_type: Any, keys_as_int: bool) -> Checker:
+    field_type = _unwrap(field_type)
+    simple = {
+        str: _check_str,
+        int: _check_int,
+        TrustClaim: _check_trust_claim,
+        TrustTier: _check_trust_tier,
+    }
+    if field_type in simple:
+        return simple[field_type]
+    if hasattr(field_type, "jc_map"):
+        return _compile_object(field_type, keys_as_int)
+    if hasattr(field_type, "items"):
+        check_value = _compile_type(get_args(field_type)[1], keys_as_int)
+
+        def check_map(value: Any, path: str):
+            if not isinstance(value, dict):
+                _fail(path, "must be a map")
+            for name, item in value.items():
+                if not isinstance(name, str):
+                    _fail(path, "keys must be strings")
+                check_value(item, f"{path}.{name}")
+
+        return check_map
+    raise TypeError(f"Cannot validate field type {field_type}")
+
+
+def _compile_object(cls: Type[BaseJCSerializable], keys_as_int: bool) -> Checker:
+    members: List[Tuple[Any, bool, bool, Checker]] = [
+        (key, is_required, nullable, _compile_type(field_type, keys_as_int))
+        for key, is_required, nullable, field_type in _fields(cls, keys_as_int)
+    ]
+
+    def check_object(value: Any, path: str):
+        if not isinstance(value, dict):
+            _fail(path, "must be a map")
+        for key, is_required, nullable, check in members:
+            item = value.get(key, MISSING)
+            if item is MISSING:
+                if is_required:
+                    _fail(path, f"missing {key!r}")
+                continue
+            if item is None and nullable:
+                continue
+            check(item, f"{path}.{key}")
+
+    return check_object
+
+
+def compile_validator(
+    cls: Type[BaseJCSerializable] = AttestationResult, keys_as_int: bool = False
+) -> Callable[..., None]:
+    # Returns a function that checks a raw claims-set against the schema of
+    # cls, raising EARValidationError, without building any objects. Anything
+    # it accepts also passes from_data() followed by validate(); it is
+    # stricter only where from_data() would coerce a value (e.g. a string iat).
+    check = _compile_object(cls, keys_as_int)
+
+    def validate(data: Any, path: Optional[str] = None):
+        check(data, path or "$")
+
+    return validate
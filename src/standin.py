@@ -0,0 +1,292 @@
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from src.claims import AttestationResult
+from src.clock import DEFAULT_CLOCK, Clock
+from src.errors import EARValidationError
+from src.jwt_config import (
+    DEFAULT_ALGORITHM,
+    DEFAULT_EXPIRATION_MINUTES,
+    generate_nonce,
+    generate_secret_key,
+)
+from src.replay import ReplayDetector
+from src.schema import compile_validator
+from src.submod import Submod
+from src.verifier_id import VerifierID
+
+# A stand-in verifier and relying party speaking HTTP/1.1 on localhost, for
+# load-testing EAR issuance and consumption without a real Veraison stack.
+#
+#   POST /issue   {"submods": {name: submod claims}, "eat_nonce": ...} -> JWT
+#   POST /verify  JWT -> the decoded claims-set as JSON
+#
+#   python -m src.standin [--port N]
+
+STANDIN_PROFILE = "tag:github.com,2023:veraison/ear"
+STANDIN_VERIFIER_ID = VerifierID(developer="veraison/python-ear", build="stand-in")
+
+_check_submod = compile_validator(Submod)
+
+_REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found"}
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: Mapping[str, str]) -> bytes:
+    return await reader.readexactly(int(headers.get("content-length", 0)))
+
+
+def _error(message: str) -> bytes:
+    return json.dumps({"error": message}).encode()
+
+
+class StandinVerifier:
+    # Issues EARs from synthetic evidence verdicts, and verifies them the way
+    # a relying party would. Both roles share one secret key.
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        secret_key: str,
+        algorithm: str = DEFAULT_ALGORITHM,
+        expiration_minutes: int = DEFAULT_EXPIRATION_MINUTES,
+        clock: Optional[Clock] = None,
+        replay_detector: Optional[ReplayDetector] = None,
+    ) -> None:
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.expiration_minutes = expiration_minutes
+        self.clock = clock or DEFAULT_CLOCK
+        self.replay_detector = replay_detector
+
+    def issue(self, verdict: Mapping[str, Any]) -> str:
+        # Turns a verdict into a signed EAR; raises EARValidationError or
+        # ValueError if the verdict is not a valid set of submods
+        if not isinstance(verdict, Mapping):
+            raise ValueError("verdict must be a JSON object")
+        submods = verdict.get("submods", {})
+        if not isinstance(submods, Mapping):
+            raise ValueError("submods must map names to JSON objects")
+        for name, claims in submods.items():
+            # from_dict() assumes well-formed claims; check them beforehand
+            _check_submod(claims, f"$.submods.{name}")
+        result = AttestationResult(
+            profile=STANDIN_PROFILE,
+            issued_at=self.clock.now(),
+            verifier_id=STANDIN_VERIFIER_ID,
+            submods={
+                name: Submod.from_dict(claims) for name, claims in submods.items()
+            },
+            nonce=verdict.get("eat_nonce"),
+        )
+        result.validate()
+        return result.encode_jwt(
+            self.secret_key, self.algorithm, self.expiration_minutes, self.clock
+        )
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        # Raises ValueError if the EAR is forged, expired or replayed
+        return AttestationResult.decode_jwt(
+            token,
+            self.secret_key,
+            self.algorithm,
+            self.clock,
+            replay_detector=self.replay_detector,
+        ).to_dict()
+
+    def handle(self, method: str, path: str, body: bytes) -> Tuple[int, bytes]:
+        # Returns the status code and JSON body of the response to a request
+        if method != "POST" or path not in ("/issue", "/verify"):
+            return 404, _error(f"no route for {method} {path}")
+        if path == "/issue":
+            try:
+                token = self.issue(json.loads(body))
+            except (EARValidationError, ValueError, KeyError, TypeError) as exc:
+                return 400, _error(str(exc))
+            return 200, json.dumps({"token": token}).encode()
+        try:
+            claims = self.verify(body.decode())
+        except ValueError as exc:
+            return 401, _error(str(exc))
+        return 200, json.dumps(claims).encode()
+
+    async def serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        # Serves requests on a keep-alive connection until the client closes it
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = await _read_headers(reader)
+                status, payload = self.handle(
+                    method, path, await _read_body(reader, headers)
+                )
+                close = headers.get("connection", "").lower() == "close"
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                        "Content-Type: application/json\r\n"
+                        f"Content-Length: {len(payload)}\r\n"
+                        f"Connection: {'close' if close else 'keep-alive'}\r\n"
+                        "\r\n"
+                    ).encode()
+                    + payload
+                )
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        # Starts listening; with port 0 the OS picks a free port, which can be
+        # read back from server.sockets[0].getsockname()
+        return await asyncio.start_server(self.serve_connection, host, port)
+
+
+class StandinClient:
+    # One keep-alive connection to a StandinVerifier
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "StandinClient":
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def request(self, path: str, body: bytes) -> Tuple[int, bytes]:
+        self.writer.write(
+            (
+                f"POST {path} HTTP/1.1\r\n"
+                "Host: localhost\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "\r\n"
+            ).encode()
+            + body
+        )
+        await self.writer.drain()
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by the server")
+        headers = await _read_headers(self.reader)
+        return int(status_line.split()[1]), await _read_body(self.reader, headers)
+
+    async def issue(self, verdict: Mapping[str, Any]) -> Tuple[int, bytes]:
+        return await self.request("/issue", json.dumps(verdict).encode())
+
+    async def verify(self, token: str) -> Tuple[int, bytes]:
+        return await self.request("/verify", token.encode())
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+@dataclass
+class LoadReport:
+    # Latencies, in seconds, of the successful requests to one endpoint
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def percentile(self, percent: float) -> float:
+        # Nearest-rank percentile
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(1, -(-len(ordered) * percent // 100))
+        return ordered[int(rank) - 1]
+
+    @property
+    def throughput(self) -> float:
+        # Successful requests per second
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+
+async def run_load(  # pylint: disable=too-many-locals
+    host: str,
+    port: int,
+    verdict: Mapping[str, Any],
+    requests: int = 1000,
+    concurrency: int = 16,
+) -> Dict[str, LoadReport]:
+    # Issues `requests` EARs from `verdict`, each with a fresh nonce, over
+    # `concurrency` connections, and verifies every EAR issued. Returns a
+    # report per endpoint.
+    reports = {"issue": LoadReport(), "verify": LoadReport()}
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        client = await StandinClient.connect(host, port)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                status, body = await client.issue(
+                    dict(verdict, eat_nonce=generate_nonce())
+                )
+                issued = time.perf_counter()
+                if status != 200:
+                    reports["issue"].errors += 1
+                    continue
+                reports["issue"].latencies.append(issued - start)
+                status, body = await client.verify(json.loads(body)["token"])
+                if status != 200:
+                    reports["verify"].errors += 1
+                    continue
+                reports["verify"].latencies.append(time.perf_counter() - issued)
+        finally:
+            await client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    for report in reports.values():
+        report.elapsed = elapsed
+    return reports
+
+
+async def _serve_forever(verifier: StandinVerifier, host: str, port: int):
+    server = await verifier.start(host, port)
+    print(f"listening on {server.sockets[0].getsockname()}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in EAR verifier")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--secret-key", default=None)
+    args = parser.parse_args()
+
+    verifier = StandinVerifier(
+        args.secret_key or generate_secret_key(), replay_detector=ReplayDetector()
+    )
+    try:
+        asyncio.run(_serve_forever(verifier, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
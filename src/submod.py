@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any, Dict, Union
 
-from src.base import BaseJCSerializable, KeyMapping
-from src.trust_tier import TrustTier
+from src.base import BaseJCSerializable, ExtensionRegistry, KeyMapping
+from src.errors import EARValidationError
+from src.trust_tier import INT_TO_TRUST_TIER, TrustTier
 from src.trust_vector import TrustVector
 
 
@@ -9,8 +11,21 @@ from src.trust_vector import TrustVector
 class Submod(BaseJCSerializable):
     trust_vector: TrustVector
     status: TrustTier
+    # claims outside jc_map, see BaseJCSerializable.extension_registry
+    extensions: Dict[str, Any] = field(default_factory=dict)
+    unknown_claims: Dict[Union[str, int], Any] = field(default_factory=dict)
 
     jc_map = {
         "status": KeyMapping(1000, "ear.status"),
         "trust_vector": KeyMapping(1001, "ear.trustworthiness-vector"),
     }
+    extension_registry = ExtensionRegistry()
+
+    def validate(self):
+        # Validates a Submod object
+        # compared by equality, as a decoded status may hold any value
+        if self.status not in INT_TO_TRUST_TIER.values():
+            raise EARValidationError(
+                f"Submod status {self.status.value!r} is not a known trust tier"
+            )
+        self.trust_vector.validate()
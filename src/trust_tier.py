@@ -7,6 +7,17 @@ from typing import Any, Dict
 class TrustTier:
     value: int
 
+    @classmethod
+    def from_data(  # pylint: disable=unused-argument
+        cls, data: Any, keys_as_int=False
+    ) -> "TrustTier":
+        # Statuses are transported as ints; tier names are read as their tier
+        # too, the same way in both key modes. Any other value is kept as it
+        # is, for validate() to reject, rather than silently replaced.
+        if isinstance(data, str) and data in STRING_TO_TRUST_TIER:
+            return STRING_TO_TRUST_TIER[data]
+        return cls(data)
+
 
 def to_trust_tier(value: Any) -> TrustTier:
     # Converts an integer or string to a TrustTier instance,
@@ -44,3 +55,27 @@ INT_TO_TRUST_TIER: Dict[int, TrustTier] = {
     TRUST_TIER_WARNING.value: TRUST_TIER_WARNING,
     TRUST_TIER_CONTRAINDICATED.value: TRUST_TIER_CONTRAINDICATED,
 }
+
+
+def _tier_of_claim_value(value: int) -> TrustTier:
+    magnitude = -value if value < 0 else value
+    if magnitude <= 1:
+        return TRUST_TIER_NONE
+    if value <= -97 or value >= 96:
+        return TRUST_TIER_CONTRAINDICATED
+    if value <= -33 or value >= 32:
+        return TRUST_TIER_WARNING
+    return TRUST_TIER_AFFIRMING
+
+
+# Trust tier of every TrustClaim value, indexed by value + 128
+# https://www.ietf.org/archive/id/draft-ietf-rats-ar4si-08.html#section-2.3.1
+_CLAIM_VALUE_TIERS = tuple(_tier_of_claim_value(value) for value in range(-128, 128))
+
+
+def claim_tier(value: int) -> TrustTier:
+    # Trust tier a TrustClaim value falls in: -1..1 none, 2..31 and -32..-2
+    # affirming, 32..95 and -96..-33 warning, the rest contraindicated
+    if not -128 <= value <= 127:
+        raise ValueError(f"TrustClaim value {value} is out of range [-128, 127]")
+    return _CLAIM_VALUE_TIERS[value + 128]
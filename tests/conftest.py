@@ -0,0 +1,42 @@
+from typing import Dict, Optional
+
+import pytest
+
+from src.claims import AttestationResult
+from src.submod import Submod
+from src.trust_claims import TrustClaim
+from src.trust_tier import TRUST_TIER_AFFIRMING, TrustTier
+from src.trust_vector import TrustVector
+from src.verifier_id import VerifierID
+
+# Builders shared by the test modules. By default a result has one affirming
+# submod, "submod1", whose eight trust claims are all 2.
+
+
+def make_submod(
+    trust_vector: Optional[TrustVector] = None,
+    status: TrustTier = TRUST_TIER_AFFIRMING,
+) -> Submod:
+    if trust_vector is None:
+        trust_vector = TrustVector(*(TrustClaim(2) for _ in range(8)))
+    return Submod(trust_vector=trust_vector, status=status)
+
+
+def make_result(
+    issued_at: int = 1234567890,
+    submods: Optional[Dict[str, Submod]] = None,
+    build: str = "v1",
+    nonce: Optional[str] = None,
+) -> AttestationResult:
+    return AttestationResult(
+        profile="test_profile",
+        issued_at=issued_at,
+        verifier_id=VerifierID(developer="Acme Inc.", build=build),
+        submods={"submod1": make_submod()} if submods is None else submods,
+        nonce=nonce,
+    )
+
+
+@pytest.fixture
+def sample_attestation_result():
+    return make_result()
@@ -0,0 +1,103 @@
+import pytest
+
+from src.base import ExtensionClaim, ExtensionRegistry
+from src.claims import AttestationResult
+from src.verifier_id import VerifierID
+
+LOCATION_CLAIM = ExtensionClaim(
+    name="location",
+    int_key=-70001,
+    str_key="acme.location",
+    decode=tuple,
+    encode=list,
+)
+
+
+@pytest.fixture
+def location_extension():
+    AttestationResult.register_extension(LOCATION_CLAIM)
+    yield LOCATION_CLAIM
+    AttestationResult.extension_registry.unregister(LOCATION_CLAIM.name)
+
+
+@pytest.fixture
+def sample_data(sample_attestation_result):
+    return sample_attestation_result.to_dict()
+
+
+def test_unknown_claims_are_preserved(sample_data):
+    sample_data["acme.firmware"] = {"version": "1.2"}
+    sample_data["submods"]["submod1"][-70002] = "opaque"
+
+    result = AttestationResult.from_dict(sample_data)
+    assert result.unknown_claims == {"acme.firmware": {"version": "1.2"}}
+    assert result.submods["submod1"].unknown_claims == {-70002: "opaque"}
+    assert result.extensions == {}
+    assert result.to_dict() == sample_data
+
+
+def test_registered_claims_are_decoded(sample_data, location_extension):
+    sample_data["acme.location"] = [51.5, -0.1]
+
+    result = AttestationResult.from_dict(sample_data)
+    assert result.extensions == {"location": (51.5, -0.1)}
+    assert result.to_dict() == sample_data
+
+    int_keys = result.to_int_keys()
+    assert int_keys[location_extension.int_key] == [51.5, -0.1]
+    assert AttestationResult.from_int_keys(int_keys) == result
+
+
+def test_unknown_claim_named_like_an_extension(sample_data, location_extension):
+    sample_data[location_extension.name] = "not a location"
+
+    result = AttestationResult.from_dict(sample_data)
+    assert result.unknown_claims == {"location": "not a location"}
+    assert result.extensions == {}
+    assert result.to_dict() == sample_data
+
+
+def test_no_extensions(sample_data):
+    result = AttestationResult.from_dict(sample_data)
+    assert result.extensions == {}
+    assert result.unknown_claims == {}
+    assert result.submods["submod1"].extensions == {}
+    assert result.submods["submod1"].unknown_claims == {}
+    assert result.to_dict() == sample_data
+
+
+def test_extensions_not_supported():
+    with pytest.raises(TypeError):
+        VerifierID.register_extension(LOCATION_CLAIM)
+
+
+@pytest.mark.parametrize(
+    "claim",
+    [
+        ExtensionClaim("p", 265, "acme.profile"),
+        ExtensionClaim("p", -70001, "eat_profile"),
+    ],
+)
+def test_extension_cannot_shadow_claims(claim):
+    with pytest.raises(ValueError, match="are claims of AttestationResult"):
+        AttestationResult.register_extension(claim)
+    assert AttestationResult.extension_registry.by_name("p") is None
+
+
+def test_registry_rejects_duplicates():
+    registry = ExtensionRegistry()
+    registry.register(LOCATION_CLAIM)
+    with pytest.raises(ValueError):
+        registry.register(LOCATION_CLAIM)
+    with pytest.raises(ValueError):
+        registry.register(ExtensionClaim("other", LOCATION_CLAIM.int_key, "other"))
+    assert registry.by_key("acme.location", keys_as_int=False) is LOCATION_CLAIM
+    assert registry.by_key(LOCATION_CLAIM.int_key, keys_as_int=True) is LOCATION_CLAIM
+    registry.unregister("location")
+    assert registry.by_name("location") is None
+
+
+def test_jwt_token_claims_are_not_extensions(sample_data):
+    result = AttestationResult.from_dict(sample_data)
+    token = result.encode_jwt(secret_key="secret")
+    assert AttestationResult.decode_jwt(token, secret_key="secret") == result
@@ -1,10 +1,12 @@
 import json
+import subprocess
+import sys
 
 import pytest
 
-from src.claims import AttestationResult
+from src.claims import AttestationResult, sign_jwt
+from src.clock import FixedClock
 from src.errors import EARValidationError
-from src.submod import Submod
 from src.trust_claims import (
     APPROVED_CONFIG_CLAIM,
     APPROVED_FILES_CLAIM,
@@ -14,37 +16,11 @@ from src.trust_claims import (
     HW_KEYS_ENCRYPTED_SECRETS_CLAIM,
     TRUSTED_SOURCES_CLAIM,
     TRUSTWORTHY_INSTANCE_CLAIM,
-    TrustClaim,
 )
-from src.trust_tier import TRUST_TIER_AFFIRMING
-from src.trust_vector import TrustVector
+from src.trust_tier import TRUST_TIER_AFFIRMING, TrustTier
 from src.verifier_id import VerifierID
 
 
-@pytest.fixture
-def sample_attestation_result():
-    return AttestationResult(
-        profile="test_profile",
-        issued_at=1234567890,
-        verifier_id=VerifierID(developer="Acme Inc.", build="v1"),
-        submods={
-            "submod1": Submod(
-                trust_vector=TrustVector(
-                    instance_identity=TrustClaim(2),
-                    configuration=TrustClaim(2),
-                    executables=TrustClaim(2),
-                    file_system=TrustClaim(2),
-                    hardware=TrustClaim(2),
-                    runtime_opaque=TrustClaim(2),
-                    storage_opaque=TrustClaim(2),
-                    sourced_data=TrustClaim(2),
-                ),
-                status=TRUST_TIER_AFFIRMING,
-            ),
-        },
-    )
-
-
 def test_attestation_result_to_dict(sample_attestation_result):
     expected = {
         "eat_profile": "test_profile",
@@ -164,3 +140,134 @@ def test_validate_ear_claims_invalid():
             profile="", issued_at=-1, verifier_id=VerifierID(developer="", build="")
         )
         invalid_attestation_result.validate()
+
+
+@pytest.mark.parametrize("module", ["jose", "src.cose", "hmac"])
+def test_import_does_not_load(module):
+    # python-jose, and the COSE/HMAC code behind CWTs, are only needed once a
+    # token is encoded or decoded
+    code = f"import sys, src.claims; print({module!r} in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "False"
+
+
+def test_encode_decode_jwt(sample_attestation_result):
+    token = sample_attestation_result.encode_jwt(secret_key="secret")
+    decoded = AttestationResult.decode_jwt(token, secret_key="secret")
+    assert decoded.to_dict() == sample_attestation_result.to_dict()
+
+
+def test_encode_jwt_uses_clock(sample_attestation_result):
+    token = sample_attestation_result.encode_jwt(
+        secret_key="secret", expiration_minutes=5, clock=FixedClock(1234567890)
+    )
+    decoded = AttestationResult.decode_jwt(
+        token, secret_key="secret", clock=FixedClock(1234567890 + 299)
+    )
+    assert decoded.issued_at == 1234567890
+
+
+def test_decode_jwt_expired(sample_attestation_result):
+    token = sample_attestation_result.encode_jwt(
+        secret_key="secret", expiration_minutes=5, clock=FixedClock(1234567890)
+    )
+    clock = FixedClock(1234567890 + 300)
+    # the expiry is checked before the signature, hence the wrong key is not hit
+    with pytest.raises(ValueError, match="expired"):
+        AttestationResult.decode_jwt(token, secret_key="wrong", clock=clock)
+    # but is tolerated within the leeway
+    AttestationResult.decode_jwt(token, secret_key="secret", clock=clock, leeway=1)
+
+
+def test_decode_jwt_issued_in_the_future(sample_attestation_result):
+    # a relying party whose clock lags the verifier's accepts fresh EARs
+    token = sample_attestation_result.encode_jwt(
+        secret_key="secret", clock=FixedClock(1234567890)
+    )
+    decoded = AttestationResult.decode_jwt(
+        token, secret_key="secret", clock=FixedClock(1234567890 - 60)
+    )
+    assert decoded == sample_attestation_result
+
+
+def test_decode_jwt_not_yet_valid(sample_attestation_result):
+    claims = dict(sample_attestation_result.to_dict(), nbf=1234567890)
+    token = sign_jwt(claims, "secret")
+    with pytest.raises(ValueError, match="not yet valid"):
+        AttestationResult.decode_jwt(
+            token, secret_key="secret", clock=FixedClock(1234567890 - 60)
+        )
+
+
+def test_decode_jwt_bad_signature(sample_attestation_result):
+    token = sample_attestation_result.encode_jwt(secret_key="secret")
+    with pytest.raises(ValueError, match="JWT decoding failed"):
+        AttestationResult.decode_jwt(token, secret_key="wrong")
+
+
+@pytest.mark.parametrize("keys_as_int", [False, True])
+def test_attestation_result_nonce(sample_attestation_result, keys_as_int):
+    assert "eat_nonce" not in sample_attestation_result.to_dict()
+    sample_attestation_result.nonce = "0123456789abcdef"
+    data = sample_attestation_result.to_data(keys_as_int=keys_as_int)
+    assert data[10 if keys_as_int else "eat_nonce"] == "0123456789abcdef"
+    decoded = AttestationResult.from_data(data, keys_as_int=keys_as_int)
+    assert decoded.nonce == "0123456789abcdef"
+    decoded.validate()
+
+
+@pytest.mark.parametrize(
+    "status, tier",
+    [(2, TRUST_TIER_AFFIRMING), ("affirming", TRUST_TIER_AFFIRMING), (7, None)],
+)
+def test_attestation_result_status(sample_attestation_result, status, tier):
+    data = sample_attestation_result.to_dict()
+    data["submods"]["submod1"]["ear.status"] = status
+    decoded = AttestationResult.from_dict(data)
+    if tier is None:
+        # unknown statuses are kept, and rejected by validate()
+        assert decoded.submods["submod1"].status == TrustTier(status)
+        with pytest.raises(EARValidationError, match="not a known trust tier"):
+            decoded.validate()
+    else:
+        assert decoded.submods["submod1"].status == tier
+        decoded.validate()
+
+
+def test_attestation_result_invalid_nonce(sample_attestation_result):
+    sample_attestation_result.nonce = ""
+    with pytest.raises(EARValidationError):
+        sample_attestation_result.validate()
+
+
+def test_encode_decode_cwt(sample_attestation_result):
+    token = sample_attestation_result.encode_cwt(
+        secret_key="secret", clock=FixedClock(1234567890)
+    )
+    decoded = AttestationResult.decode_cwt(
+        token, secret_key="secret", clock=FixedClock(1234567890)
+    )
+    assert decoded == sample_attestation_result
+
+
+@pytest.mark.parametrize(
+    "secret_key, algorithm, now, message",
+    [
+        ("wrong", "HS256", 1234567890, "Signature verification failed"),
+        ("secret", "HS512", 1234567890, "alg value is not allowed"),
+        ("secret", "RS256", 1234567890, "Unsupported"),
+        ("wrong", "HS256", 1234567890 + 3600, "expired"),
+    ],
+)
+def test_decode_cwt_invalid(  # pylint: disable=too-many-arguments
+    sample_attestation_result, secret_key, algorithm, now, message
+):
+    token = sample_attestation_result.encode_cwt(
+        secret_key="secret", clock=FixedClock(1234567890)
+    )
+    with pytest.raises(ValueError, match=message):
+        AttestationResult.decode_cwt(
+            token, secret_key=secret_key, algorithm=algorithm, clock=FixedClock(now)
+        )
@@ -0,0 +1,68 @@
+import time
+
+import pytest
+
+from src.clock import (
+    CWT_TIME_KEYS,
+    DEFAULT_CLOCK,
+    FixedClock,
+    MonotonicClock,
+    SystemClock,
+    check_time_claims,
+)
+
+
+def test_system_clock():
+    before = int(time.time())
+    assert before <= SystemClock().now() <= int(time.time())
+
+
+def test_default_clock_is_wall_clock():
+    assert isinstance(DEFAULT_CLOCK, SystemClock)
+
+
+def test_monotonic_clock_tracks_wall_clock():
+    clock = MonotonicClock()
+    assert abs(clock.now() - int(time.time())) <= 1
+
+
+def test_fixed_clock():
+    assert FixedClock(1234567890).now() == 1234567890
+
+
+def test_check_time_claims_valid():
+    # Should not raise an error
+    check_time_claims({"iat": 100, "exp": 200}, now=150)
+    check_time_claims({}, now=150)
+    # NumericDates need not be integers
+    check_time_claims({"iat": 100.5, "nbf": 149.5, "exp": 150.5}, now=150)
+    # an iat in the future, e.g. from a verifier whose clock runs ahead
+    check_time_claims({"iat": 151}, now=150)
+
+
+@pytest.mark.parametrize(
+    "claims, message",
+    [
+        ({"exp": 150}, "expired"),
+        ({"exp": 100}, "expired"),
+        ({"nbf": 151}, "nbf"),
+        ({"nbf": 150.5}, "nbf"),
+        ({"exp": "200"}, "exp must be a number"),
+        ({"iat": "100"}, "iat must be a number"),
+        ({"exp": True}, "exp must be a number"),
+    ],
+)
+def test_check_time_claims_invalid(claims, message):
+    with pytest.raises(ValueError, match=message):
+        check_time_claims(claims, now=150)
+
+
+def test_check_time_claims_leeway():
+    check_time_claims({"exp": 145, "iat": 155}, now=150, leeway=10)
+    with pytest.raises(ValueError):
+        check_time_claims({"exp": 140}, now=150, leeway=10)
+
+
+def test_check_time_claims_int_keys():
+    with pytest.raises(ValueError, match="expired"):
+        check_time_claims({4: 100, 6: 50}, now=150, keys=CWT_TIME_KEYS)
@@ -0,0 +1,107 @@
+import pytest
+
+from src.clock import FixedClock
+from src.codec import (
+    CBOR,
+    CWT,
+    FORMATS,
+    JSON,
+    JWT,
+    SIGNED_FORMATS,
+    decode,
+    encode,
+    sniff_format,
+)
+from src.peek import peek_cwt
+from src.trust_claims import TrustClaim
+from src.trust_vector import TrustVector
+from tests.conftest import make_result, make_submod
+
+CLOCK = FixedClock(1234567890)
+
+
+@pytest.fixture
+def sample_attestation_result():
+    # a partial trust vector and a nonce, to cover optional claims
+    return make_result(
+        submods={"submod1": make_submod(TrustVector(TrustClaim(2), TrustClaim(3)))},
+        nonce="0123456789abcdef",
+    )
+
+
+def test_to_data_pair(sample_attestation_result):
+    str_data, int_data = sample_attestation_result.to_data_pair()
+    assert str_data == sample_attestation_result.to_dict()
+    assert int_data == sample_attestation_result.to_int_keys()
+
+
+def test_encode_matches_single_format_encoders(sample_attestation_result):
+    encoded = encode(sample_attestation_result, secret_key="secret", clock=CLOCK)
+
+    assert set(encoded) == set(FORMATS)
+    assert encoded[JSON] == sample_attestation_result.to_json()
+    assert encoded[JWT] == sample_attestation_result.encode_jwt("secret", clock=CLOCK)
+    assert encoded[CWT] == sample_attestation_result.encode_cwt("secret", clock=CLOCK)
+    assert peek_cwt(encoded[CWT]).expires_at == 1234567890 + 3600
+
+
+def test_encode_selected_formats(sample_attestation_result):
+    encoded = encode(sample_attestation_result, formats=[CBOR, JSON, CBOR])
+    assert list(encoded) == [CBOR, JSON]
+
+
+def test_encode_errors(sample_attestation_result):
+    with pytest.raises(ValueError, match="Unknown formats"):
+        encode(sample_attestation_result, formats=["xml"])
+    with pytest.raises(ValueError, match="secret_key"):
+        encode(sample_attestation_result, formats=[JWT])
+
+
+@pytest.mark.parametrize("kind", FORMATS)
+def test_decode_sniffs_format(sample_attestation_result, kind):
+    data = encode(sample_attestation_result, secret_key="secret", clock=CLOCK)[kind]
+    assert sniff_format(data) == kind
+    if kind in SIGNED_FORMATS:
+        decoded = decode(data, secret_key="secret", clock=CLOCK)
+    else:
+        decoded = decode(data, clock=CLOCK, formats=FORMATS)
+    assert decoded == sample_attestation_result
+
+
+@pytest.mark.parametrize("kind", [JSON, CBOR])
+def test_decode_refuses_unsigned(sample_attestation_result, kind):
+    sample_attestation_result.verifier_id.developer = "Forged Inc."
+    data = encode(sample_attestation_result, formats=[kind])[kind]
+    with pytest.raises(ValueError, match="not accepted"):
+        decode(data)
+    with pytest.raises(ValueError, match="not accepted"):
+        decode(data, secret_key="secret")
+    # opting in to unsigned formats does not lift the check for key holders
+    with pytest.raises(ValueError, match="unsigned"):
+        decode(data, secret_key="secret", formats=FORMATS)
+
+
+@pytest.mark.parametrize(
+    "data", [b"\xa0", b"\xa1", b"\xa1\x06\x01", "{}", '{"iat": 1', "{ }x"]
+)
+def test_decode_malformed_unsigned(data):
+    with pytest.raises(ValueError, match="decoding failed"):
+        decode(data, formats=FORMATS)
+
+
+def test_sniff_text_as_bytes(sample_attestation_result):
+    encoded = encode(sample_attestation_result, secret_key="secret", clock=CLOCK)
+    assert sniff_format(encoded[JSON].encode()) == JSON
+    assert sniff_format(encoded[JWT].encode()) == JWT
+
+
+@pytest.mark.parametrize("data", ["", "hello", b"\xff\xfe", b"\x01\x02"])
+def test_sniff_unrecognised(data):
+    with pytest.raises(ValueError):
+        sniff_format(data)
+
+
+def test_decode_token_needs_key(sample_attestation_result):
+    token = sample_attestation_result.encode_jwt("secret")
+    with pytest.raises(ValueError, match="secret_key"):
+        decode(token)
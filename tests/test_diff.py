@@ -0,0 +1,107 @@
+import pytest
+
+from src.diff import (
+    ChangeTracker,
+    ClaimChange,
+    StatusChange,
+    compact_trust_vector,
+    diff_results,
+    diff_submods,
+    diff_trust_vectors,
+)
+from src.trust_claims import (
+    APPROVED_CONFIG_CLAIM,
+    TRUSTWORTHY_INSTANCE_CLAIM,
+    UNSAFE_CONFIG_CLAIM,
+    UNSUPPORTABLE_CONFIG_CLAIM,
+)
+from src.trust_tier import (
+    TRUST_TIER_AFFIRMING,
+    TRUST_TIER_CONTRAINDICATED,
+    TRUST_TIER_WARNING,
+)
+from src.trust_vector import TrustVector
+from tests.conftest import make_result, make_submod
+
+
+def cpu_result(configuration=APPROVED_CONFIG_CLAIM, status=TRUST_TIER_AFFIRMING):
+    trust_vector = TrustVector(
+        instance_identity=TRUSTWORTHY_INSTANCE_CLAIM, configuration=configuration
+    )
+    return make_result(submods={"cpu": make_submod(trust_vector, status)})
+
+
+def test_compact_trust_vector():
+    vector = TrustVector(instance_identity=TRUSTWORTHY_INSTANCE_CLAIM)
+    assert compact_trust_vector(vector) == (2, None, None, None, None, None, None, None)
+
+
+def test_diff_trust_vectors():
+    old = TrustVector(configuration=APPROVED_CONFIG_CLAIM)
+    new = TrustVector(configuration=UNSAFE_CONFIG_CLAIM, hardware=None)
+    assert diff_trust_vectors(old, new) == [
+        ClaimChange(
+            None, "configuration", 2, 32, TRUST_TIER_AFFIRMING, TRUST_TIER_WARNING
+        )
+    ]
+    assert not diff_trust_vectors(old, old)
+
+
+def test_diff_results():
+    old = cpu_result()
+    new = cpu_result(UNSUPPORTABLE_CONFIG_CLAIM, TRUST_TIER_CONTRAINDICATED)
+    diff = diff_results(old, new)
+
+    assert diff
+    assert diff.status_changes == [
+        StatusChange("cpu", TRUST_TIER_AFFIRMING, TRUST_TIER_CONTRAINDICATED)
+    ]
+    assert [change.category for change in diff.tier_changes] == ["configuration"]
+    assert not diff_results(old, cpu_result())
+
+
+def test_diff_results_added_and_removed_submods():
+    old = cpu_result()
+    new = cpu_result()
+    new.submods["gpu"] = new.submods.pop("cpu")
+    diff = diff_results(old, new)
+
+    assert diff.added_submods == ["gpu"]
+    assert diff.removed_submods == ["cpu"]
+    assert {
+        (change.submod, change.old, change.new) for change in diff.status_changes
+    } == {
+        ("gpu", None, TRUST_TIER_AFFIRMING),
+        ("cpu", TRUST_TIER_AFFIRMING, None),
+    }
+    assert len(diff.claim_changes) == 4
+
+
+def test_diff_submods():
+    old = cpu_result().submods["cpu"]
+    new = cpu_result(status=TRUST_TIER_WARNING).submods["cpu"]
+    diff = diff_submods(old, new, "cpu")
+    assert diff.status_changes == [
+        StatusChange("cpu", TRUST_TIER_AFFIRMING, TRUST_TIER_WARNING)
+    ]
+    assert not diff.claim_changes
+
+
+@pytest.fixture
+def tracker():
+    return ChangeTracker()
+
+
+def test_change_tracker(tracker):
+    assert tracker.update("attester-1", cpu_result()) is None
+    assert tracker.update("attester-1", cpu_result()) is None
+    assert tracker.update("attester-2", cpu_result(UNSAFE_CONFIG_CLAIM)) is None
+
+    diff = tracker.update("attester-1", cpu_result(UNSAFE_CONFIG_CLAIM))
+    assert diff is not None
+    assert [change.new for change in diff.claim_changes] == [32]
+    assert tracker.update("attester-2", cpu_result(UNSAFE_CONFIG_CLAIM)) is None
+    assert len(tracker) == 2
+
+    tracker.forget("attester-1")
+    assert tracker.update("attester-1", cpu_result()) is None
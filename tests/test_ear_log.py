@@ -0,0 +1,87 @@
+import pytest
+
+from src.ear_log import EARLog, EARLogWriter
+from tests.conftest import make_result
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "ears.log")
+
+
+def write(log_path, issued_ats):
+    with EARLogWriter(log_path) as writer:
+        return [writer.append(make_result(issued_at)) for issued_at in issued_ats]
+
+
+def test_append_and_lookup(log_path):
+    assert write(log_path, [100, 200, 300]) == [0, 1, 2]
+
+    with EARLog(log_path) as log:
+        assert len(log) == 3
+        assert log[1].to_dict() == make_result(200).to_dict()
+        assert log[-1].issued_at == 300
+        with pytest.raises(IndexError):
+            log[3]  # pylint: disable=pointless-statement
+        assert log.issued_at(1) == 200
+        assert log.issued_at(-1) == 300
+        for seq in (3, -4):
+            with pytest.raises(IndexError):
+                log.issued_at(seq)
+
+
+def test_reopen_appends(log_path):
+    write(log_path, [100, 200])
+    assert write(log_path, [300]) == [2]
+
+    with EARLog(log_path) as log:
+        assert [log[seq].issued_at for seq in range(len(log))] == [100, 200, 300]
+
+
+@pytest.mark.parametrize("suffix", [".idx", ""])
+def test_reopen_after_torn_append(log_path, suffix):
+    # a crash mid-append leaves half an index entry or an unindexed record
+    write(log_path, [100, 200])
+    with open(log_path + suffix, "ab") as torn:
+        torn.write(b"\x01\x02\x03")
+    assert write(log_path, [300]) == [2]
+
+    with EARLog(log_path) as log:
+        assert [log[seq].issued_at for seq in range(len(log))] == [100, 200, 300]
+
+
+@pytest.mark.parametrize(
+    "issued_ats",
+    [
+        [100, 200, 200, 300, 400],  # sorted, binary searched
+        [300, 100, 200, 400, 200],  # unsorted, scanned
+    ],
+)
+def test_range_issued_at(log_path, issued_ats):
+    write(log_path, issued_ats)
+
+    with EARLog(log_path) as log:
+        found = [
+            (seq, result.issued_at) for seq, result in log.range_issued_at(200, 400)
+        ]
+    expected = [
+        (seq, issued_at)
+        for seq, issued_at in enumerate(issued_ats)
+        if 200 <= issued_at < 400
+    ]
+    assert found == expected
+
+
+def test_unsorted_flag_persists(log_path):
+    write(log_path, [300, 100])
+    write(log_path, [400])
+
+    with EARLog(log_path) as log:
+        assert [seq for seq, _ in log.range_issued_at(0, 350)] == [0, 1]
+
+
+def test_not_a_log(log_path):
+    with open(log_path, "wb") as file:
+        file.write(b"garbage!")
+    with pytest.raises(ValueError):
+        EARLogWriter(log_path)
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from src.claims import AttestationResult
+from src.errors import EARValidationError
+from src.fuzz import (
+    CODECS,
+    random_attestation_result,
+    random_equivalent_data,
+    random_invalid_data,
+    roundtrip,
+)
+from src.schema import compile_validator
+
+SEEDS = range(50)
+
+
+@pytest.mark.parametrize("codec", sorted(CODECS))
+def test_roundtrip(codec):
+    rng = random.Random(codec)
+    for _ in SEEDS:
+        result = random_attestation_result(rng)
+        result.validate()
+        assert roundtrip(result, codec) == result
+
+
+@pytest.mark.parametrize("keys_as_int", [False, True])
+def test_equivalent_mutations(keys_as_int):
+    rng = random.Random(0)
+    validator = compile_validator(keys_as_int=keys_as_int)
+    for _ in SEEDS:
+        name, result, data = random_equivalent_data(rng, keys_as_int)
+        validator(data)
+        decoded = AttestationResult.from_data(data, keys_as_int=keys_as_int)
+        assert decoded == result, name
+
+
+@pytest.mark.parametrize("keys_as_int", [False, True])
+def test_invalid_mutations(keys_as_int):
+    rng = random.Random(0)
+    validator = compile_validator(keys_as_int=keys_as_int)
+    for _ in SEEDS:
+        _, data = random_invalid_data(rng, keys_as_int)
+        with pytest.raises(EARValidationError):
+            validator(data)
+        with pytest.raises(EARValidationError):
+            AttestationResult.from_data(data, keys_as_int=keys_as_int).validate()
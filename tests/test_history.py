@@ -0,0 +1,98 @@
+import pytest
+
+from src.history import EARHistory, apply_patch, diff_data
+from src.trust_claims import (
+    APPROVED_CONFIG_CLAIM,
+    TRUSTWORTHY_INSTANCE_CLAIM,
+    UNSAFE_CONFIG_CLAIM,
+)
+from src.trust_tier import TRUST_TIER_AFFIRMING, TRUST_TIER_WARNING
+from src.trust_vector import TrustVector
+from tests.conftest import make_result, make_submod
+
+
+def history_result(issued_at, configuration=APPROVED_CONFIG_CLAIM, extra_submod=False):
+    submods = {
+        "submod1": make_submod(
+            TrustVector(
+                instance_identity=TRUSTWORTHY_INSTANCE_CLAIM,
+                configuration=configuration,
+            ),
+            (
+                TRUST_TIER_AFFIRMING
+                if configuration == APPROVED_CONFIG_CLAIM
+                else TRUST_TIER_WARNING
+            ),
+        )
+    }
+    if extra_submod:
+        submods["submod2"] = make_submod(
+            TrustVector(instance_identity=TRUSTWORTHY_INSTANCE_CLAIM)
+        )
+    return make_result(issued_at, submods)
+
+
+@pytest.fixture
+def results():
+    return [
+        history_result(
+            1234567890 + i,
+            configuration=UNSAFE_CONFIG_CLAIM if i % 3 == 0 else APPROVED_CONFIG_CLAIM,
+            extra_submod=i % 4 == 0,
+        )
+        for i in range(10)
+    ]
+
+
+def test_diff_and_apply_patch():
+    old = {1: "a", 2: {"x": 1, "y": 2}, 3: [1]}
+    new = {1: "a", 2: {"x": 1, "y": 3}, 4: "d"}
+    patch = diff_data(old, new)
+    assert patch == {0: {4: "d"}, 1: [3], 2: {2: {0: {"y": 3}}}}
+    assert apply_patch(old, patch) == new
+    assert old == {1: "a", 2: {"x": 1, "y": 2}, 3: [1]}
+    assert not diff_data(new, new)
+
+
+@pytest.mark.parametrize("keyframe_interval", [1, 3, 32])
+def test_history_random_access(results, keyframe_interval):
+    history = EARHistory(keyframe_interval=keyframe_interval)
+    for result in results:
+        history.append(result)
+
+    assert len(history) == len(results)
+    for index, result in enumerate(results):
+        assert history[index].to_int_keys() == result.to_int_keys()
+    assert history[-1].to_int_keys() == results[-1].to_int_keys()
+
+
+def test_history_index_error():
+    with pytest.raises(IndexError):
+        EARHistory()[0]  # pylint: disable=expression-not-assigned
+
+
+def test_history_invalid_interval():
+    with pytest.raises(ValueError):
+        EARHistory(keyframe_interval=0)
+
+
+def test_history_bytes_roundtrip(results):
+    history = EARHistory(keyframe_interval=4)
+    for result in results[:5]:
+        history.append(result)
+
+    restored = EARHistory.from_bytes(history.to_bytes())
+    for result in results[5:]:
+        restored.append(result)
+
+    assert len(restored) == len(results)
+    for index, result in enumerate(results):
+        assert restored[index].to_int_keys() == result.to_int_keys()
+
+
+def test_history_is_smaller_than_full_records(results):
+    history = EARHistory()
+    for result in results:
+        history.append(result)
+    full = sum(len(result.to_json()) for result in results)
+    assert len(history.to_bytes()) < full / 2
@@ -0,0 +1,112 @@
+import pytest
+
+from src.claims import sign_jwt, verify_jwt
+from src.clock import FixedClock
+from src.jws import b64url_decode, b64url_encode, unverified_jwt_segments
+from src.keys import KeyRing, hkdf_sha256
+from src.replay import ReplayDetector
+
+EPOCH = 3600
+
+
+@pytest.fixture
+def clock():
+    return FixedClock(500_000 * EPOCH)
+
+
+@pytest.fixture
+def keyring(clock):
+    return KeyRing("master-secret", epoch_seconds=EPOCH, window=2, clock=clock)
+
+
+def test_hkdf_sha256_rfc5869():
+    # RFC 5869, test case 1
+    okm = hkdf_sha256(
+        bytes([0x0B] * 22), bytes(range(0xF0, 0xFA)), 42, salt=bytes(range(13))
+    )
+    assert okm.hex() == (
+        "3cb25f25faacd57a90434f64d0362f2a2d2d0a90cf1a5a4c5db02d56ecc4c5bf"
+        "34007208d5b887185865"
+    )
+
+
+def test_keys_per_epoch(keyring):
+    assert keyring.key(500_000) == keyring.key(500_000)
+    assert keyring.key(500_000) != keyring.key(500_001)
+    assert keyring.key(500_000) != KeyRing("other").key(500_000)
+    assert len(keyring.key(500_000)) == 32
+
+
+def test_sign_and_verify(keyring):
+    token = keyring.sign({"iat": 1, "foo": "bar"})
+    header, _ = unverified_jwt_segments(token)
+    assert header["kid"] == "500000"
+    assert keyring.verify(token) == {"iat": 1, "foo": "bar"}
+
+
+def test_interoperates_with_jose(keyring, clock):
+    token = keyring.sign({"foo": "bar"})
+    assert verify_jwt(token, keyring.key(500_000), clock=clock) == {"foo": "bar"}
+    token = sign_jwt({"foo": "bar"}, keyring.key(500_000), headers={"kid": "500000"})
+    assert keyring.verify(token) == {"foo": "bar"}
+    with pytest.raises(ValueError, match="no kid"):
+        keyring.verify(sign_jwt({"foo": "bar"}, keyring.key(500_000)))
+
+
+def test_rotation_window(keyring, clock):
+    token = keyring.sign({"foo": "bar"})
+    clock.timestamp += EPOCH
+    assert keyring.verify(token) == {"foo": "bar"}
+    assert unverified_jwt_segments(keyring.sign({}))[0]["kid"] == "500001"
+    clock.timestamp += EPOCH
+    with pytest.raises(ValueError, match="not active"):
+        keyring.verify(token)
+    assert 500_000 not in keyring._macs  # pylint: disable=protected-access
+
+
+def test_verify_rejects(keyring, clock):
+    token = keyring.sign({"exp": clock.now() + 10})
+    head, payload, signature = token.split(".")
+    forged = b64url_encode(bytes(len(b64url_decode(signature))))
+    with pytest.raises(ValueError, match="signature verification failed"):
+        keyring.verify(f"{head}.{payload}.{forged}")
+    with pytest.raises(ValueError, match="not active"):
+        keyring.verify(KeyRing("master-secret", EPOCH, clock=FixedClock(0)).sign({}))
+    with pytest.raises(ValueError, match="unexpected algorithm"):
+        KeyRing("master-secret", EPOCH, algorithm="HS512", clock=clock).verify(token)
+    clock.timestamp += 10
+    with pytest.raises(ValueError, match="token has expired"):
+        keyring.verify(token)
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError, match="unsupported algorithm"):
+        KeyRing("master-secret", algorithm="RS256")
+    with pytest.raises(ValueError, match="must be positive"):
+        KeyRing("master-secret", window=0)
+
+
+def test_encode_decode_jwt(keyring, sample_attestation_result):
+    token = keyring.encode_jwt(sample_attestation_result)
+    assert keyring.decode_jwt(token) == sample_attestation_result
+
+
+def test_verify_next_epoch_within_leeway(keyring, clock):
+    # signed just after the epoch boundary by a signer whose clock is 1s ahead
+    signer = KeyRing("master-secret", EPOCH, clock=FixedClock(clock.now() + EPOCH))
+    token = signer.sign({"foo": "bar"})
+    clock.timestamp += EPOCH - 1
+    assert keyring.verify(token, leeway=60) == {"foo": "bar"}
+    with pytest.raises(ValueError, match="not active"):
+        keyring.verify(token, leeway=0)
+
+
+def test_decode_jwt_replay(keyring, sample_attestation_result):
+    sample_attestation_result.nonce = "bm9uY2Utbm9uY2U="
+    token = keyring.encode_jwt(sample_attestation_result)
+    detector = ReplayDetector()
+    assert keyring.decode_jwt(token, replay_detector=detector) == (
+        sample_attestation_result
+    )
+    with pytest.raises(ValueError, match="replayed"):
+        keyring.decode_jwt(token, replay_detector=detector)
@@ -0,0 +1,66 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from src.errors import EARValidationError
+from src.parallel import decode_attestation_result
+from src.trust_claims import TrustClaim
+from src.trust_vector import TrustVector
+from tests.conftest import make_result, make_submod
+
+
+@pytest.fixture
+def sample_attestation_result():
+    return make_result(
+        submods={
+            f"component-{n}": make_submod(
+                TrustVector(
+                    *(TrustClaim((n + category) % 128) for category in range(8))
+                )
+            )
+            for n in range(50)
+        },
+    )
+
+
+@pytest.mark.parametrize("keys_as_int", [False, True])
+def test_parallel_matches_sequential(sample_attestation_result, keys_as_int):
+    data = sample_attestation_result.to_data(keys_as_int=keys_as_int)
+    sequential = decode_attestation_result(data, keys_as_int=keys_as_int)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = decode_attestation_result(
+            data, keys_as_int=keys_as_int, executor=executor, threshold=0
+        )
+
+    assert parallel == sequential
+    assert list(parallel.submods) == list(sample_attestation_result.submods)
+
+
+def test_parallel_own_pool(sample_attestation_result):
+    data = sample_attestation_result.to_dict()
+    result = decode_attestation_result(data, threshold=10, max_workers=2)
+    assert result.to_dict() == data
+
+
+def test_parallel_validation_error(sample_attestation_result):
+    data = sample_attestation_result.to_dict()
+    data["submods"]["component-7"]["ear.trustworthiness-vector"]["hardware"] = 300
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(EARValidationError):
+            decode_attestation_result(data, executor=executor, threshold=0)
+        # validation can be left to the caller
+        decode_attestation_result(data, executor=executor, threshold=0, validate=False)
+
+
+def test_parallel_unknown_status(sample_attestation_result):
+    data = sample_attestation_result.to_dict()
+    data["submods"]["component-7"]["ear.status"] = 7
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(EARValidationError, match="not a known trust tier"):
+            decode_attestation_result(data, executor=executor, threshold=0)
+
+
+def test_parallel_empty_submods(sample_attestation_result):
+    data = sample_attestation_result.to_dict()
+    data["submods"] = {}
+    assert decode_attestation_result(data, threshold=0).submods == {}
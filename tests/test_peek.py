@@ -0,0 +1,84 @@
+from dataclasses import replace
+
+import cbor2
+import pytest
+
+from src.clock import FixedClock
+from src.peek import UntrustedClaims, peek, peek_cwt, peek_jwt
+from src.trust_claims import TRUSTWORTHY_INSTANCE_CLAIM
+from src.trust_vector import TrustVector
+from tests.conftest import make_result, make_submod
+
+
+@pytest.fixture
+def sample_attestation_result():
+    return make_result(
+        submods={
+            name: make_submod(TrustVector(instance_identity=TRUSTWORTHY_INSTANCE_CLAIM))
+            for name in ("submod1", "submod2")
+        },
+    )
+
+
+@pytest.fixture
+def expected():
+    return UntrustedClaims(
+        profile="test_profile",
+        verifier_id={"developer": "Acme Inc.", "build": "v1"},
+        issued_at=1234567890,
+        expires_at=1234567890 + 3600,
+        submod_names=("submod1", "submod2"),
+    )
+
+
+def test_peek_jwt(sample_attestation_result, expected):
+    token = sample_attestation_result.encode_jwt(
+        secret_key="secret", expiration_minutes=60, clock=FixedClock(1234567890)
+    )
+    claims = peek_jwt(token)
+    assert claims.header == {"alg": "HS256", "typ": "JWT"}
+    assert claims == replace(expected, header=claims.header)
+    assert peek(token) == claims
+
+
+def test_peek_cwt(sample_attestation_result, expected):
+    payload = sample_attestation_result.to_int_keys()
+    payload[4] = 1234567890 + 3600
+    protected = cbor2.dumps({1: 5})  # alg: HMAC 256/256
+    mac0 = cbor2.CBORTag(17, [protected, {4: b"kid"}, cbor2.dumps(payload), b"tag"])
+    token = cbor2.dumps(cbor2.CBORTag(61, mac0))
+
+    claims = peek_cwt(token)
+    assert claims.header == {1: 5, 4: b"kid"}
+    assert claims.profile == expected.profile
+    assert claims.verifier_id == expected.verifier_id
+    assert claims.issued_at == expected.issued_at
+    assert claims.expires_at == expected.expires_at
+    assert claims.submod_names == expected.submod_names
+    assert peek(token) == claims
+
+
+def test_peek_missing_claims():
+    claims = peek_cwt(cbor2.dumps([b"", {}, cbor2.dumps({265: "p"}), b""]))
+    assert claims == UntrustedClaims(profile="p")
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not-a-token",
+        "a.b",
+        b"\x01",
+        cbor2.dumps(cbor2.CBORTag(1, 0)),
+        cbor2.dumps(cbor2.CBORTag(16, [b"", {}, cbor2.dumps({265: "p"}), b""])),
+        cbor2.dumps([b"", {}, cbor2.dumps([1, 2]), b""]),
+        cbor2.dumps([cbor2.dumps(5), {}, cbor2.dumps({265: "p"}), b""]),
+        b"",
+        cbor2.dumps([b"", {}, cbor2.dumps({265: "p"}), b""])[:-3],
+        cbor2.dumps([{1: 2}, {}, cbor2.dumps({265: "p"}), b""]),
+        cbor2.dumps([b"", {}, {265: "p"}, b""]),
+    ],
+)
+def test_peek_invalid(token):
+    with pytest.raises(ValueError):
+        peek(token)
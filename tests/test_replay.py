@@ -0,0 +1,119 @@
+from functools import partial
+
+import pytest
+
+from src.claims import AttestationResult
+from src.clock import FixedClock
+from src.replay import ReplayDetector
+from src.verifier_id import VerifierID
+
+
+@pytest.fixture
+def clock():
+    return FixedClock(1000)
+
+
+@pytest.fixture
+def detector(clock):
+    return ReplayDetector(bucket_seconds=60, clock=clock)
+
+
+def test_detects_replay(detector):
+    assert detector.check_and_record("nonce-1", exp=1300)
+    assert not detector.check_and_record("nonce-1", exp=1300)
+    # the same nonce in a token with another exp is a replay too
+    assert not detector.check_and_record("nonce-1", exp=2000)
+    assert detector.check_and_record("nonce-2", exp=1300)
+    assert len(detector) == 2
+
+
+def test_rejects_expired(detector):
+    assert not detector.check_and_record("nonce-1", exp=1000)
+    assert len(detector) == 0
+
+
+def test_evicts_expired_buckets(detector, clock):
+    detector.check_and_record("early", exp=1100)  # bucket [1080, 1140)
+    detector.check_and_record("late", exp=1500)  # bucket [1500, 1560)
+
+    clock.timestamp = 1139
+    detector.evict()
+    assert len(detector) == 2
+
+    clock.timestamp = 1140
+    detector.evict()
+    assert len(detector) == 1
+    # "early" has expired, so it is rejected rather than recorded again
+    assert not detector.check_and_record("early", exp=1100)
+    assert not detector.check_and_record("late", exp=1500)
+
+
+def test_leeway(detector):
+    # a token accepted within the leeway is recorded, and kept until its
+    # exp plus the leeway has passed
+    assert not detector.check_and_record("nonce-1", exp=995)
+    assert detector.check_and_record("nonce-1", exp=995, leeway=30)
+    assert not detector.check_and_record("nonce-1", exp=995, leeway=30)
+    detector.evict(1025)
+    assert len(detector) == 1
+    detector.evict(1080)
+    assert len(detector) == 0
+
+
+def test_decode_jwt_with_leeway(detector, clock):
+    result = AttestationResult(
+        profile="test_profile",
+        issued_at=900,
+        verifier_id=VerifierID(developer="Acme Inc.", build="v1"),
+        nonce="0123456789abcdef",
+    )
+    token = result.encode_jwt(secret_key="secret", clock=clock, expiration_minutes=1)
+    clock.timestamp += 65  # expired 5 seconds ago
+    decode = partial(
+        AttestationResult.decode_jwt,
+        token,
+        secret_key="secret",
+        clock=clock,
+        leeway=30,
+        replay_detector=detector,
+    )
+    assert decode() == result
+    with pytest.raises(ValueError, match="replayed"):
+        decode()
+
+
+def test_invalid_bucket_seconds():
+    with pytest.raises(ValueError):
+        ReplayDetector(bucket_seconds=0)
+
+
+def test_decode_jwt_with_replay_detector(detector, clock):
+    result = AttestationResult(
+        profile="test_profile",
+        issued_at=900,
+        verifier_id=VerifierID(developer="Acme Inc.", build="v1"),
+        nonce="0123456789abcdef",
+    )
+    token = result.encode_jwt(secret_key="secret", clock=clock)
+
+    decoded = AttestationResult.decode_jwt(
+        token, secret_key="secret", clock=clock, replay_detector=detector
+    )
+    assert decoded == result
+    with pytest.raises(ValueError, match="replayed"):
+        AttestationResult.decode_jwt(
+            token, secret_key="secret", clock=clock, replay_detector=detector
+        )
+
+
+def test_decode_jwt_without_nonce(detector, clock):
+    result = AttestationResult(
+        profile="test_profile",
+        issued_at=900,
+        verifier_id=VerifierID(developer="Acme Inc.", build="v1"),
+    )
+    token = result.encode_jwt(secret_key="secret", clock=clock)
+    with pytest.raises(ValueError, match="no nonce"):
+        AttestationResult.decode_jwt(
+            token, secret_key="secret", clock=clock, replay_detector=detector
+        )
@@ -0,0 +1,91 @@
+import pickle
+
+import pytest
+
+from src.rollup import TierRollup
+from src.trust_tier import (
+    TRUST_TIER_AFFIRMING,
+    TRUST_TIER_CONTRAINDICATED,
+    TRUST_TIER_WARNING,
+)
+from tests.conftest import make_result, make_submod
+
+
+def rollup_result(build, **statuses):
+    return make_result(
+        build=build,
+        submods={name: make_submod(status=status) for name, status in statuses.items()},
+    )
+
+
+@pytest.fixture
+def results():
+    return [
+        rollup_result("v1", cpu=TRUST_TIER_AFFIRMING, gpu=TRUST_TIER_WARNING),
+        rollup_result("v1", cpu=TRUST_TIER_AFFIRMING, gpu=TRUST_TIER_AFFIRMING),
+        rollup_result("v1", cpu=TRUST_TIER_CONTRAINDICATED),
+        rollup_result("v2", cpu=TRUST_TIER_WARNING),
+    ]
+
+
+def test_rollup_report(results):
+    rollup = TierRollup()
+    rollup.update(results)
+
+    assert len(rollup) == 3
+    rows = {(row.build, row.submod): row for row in rollup.report()}
+    cpu = rows[("v1", "cpu")]
+    assert cpu.total == 3
+    assert cpu.counts == {
+        "none": 0,
+        "affirming": 2,
+        "warning": 0,
+        "contraindicated": 1,
+    }
+    assert cpu.percentages["affirming"] == pytest.approx(200 / 3)
+    assert rows[("v1", "gpu")].percentages["warning"] == 50.0
+    assert rows[("v2", "cpu")].counts["warning"] == 1
+
+
+def test_rollup_sources_agree(results):
+    from_objects = TierRollup()
+    from_dicts = TierRollup()
+    from_int_keys = TierRollup()
+    from_tokens = TierRollup()
+    for result in results:
+        from_objects.add(result)
+        from_dicts.add_data(result.to_dict())
+        from_int_keys.add_data(result.to_int_keys(), keys_as_int=True)
+        from_tokens.add_jwt(result.encode_jwt(secret_key="secret"), "secret")
+
+    expected = from_objects.report()
+    assert from_dicts.report() == expected
+    assert from_int_keys.report() == expected
+    assert from_tokens.report() == expected
+
+
+def test_rollup_string_and_unknown_status():
+    rollup = TierRollup()
+    data = rollup_result("v1", cpu=TRUST_TIER_AFFIRMING).to_dict()
+    data["submods"]["cpu"]["ear.status"] = "warning"
+    rollup.add_data(data)
+    data["submods"]["cpu"]["ear.status"] = 7
+    rollup.add_data(data)
+    assert rollup.counts("test_profile", "v1", "cpu") == {
+        "none": 1,
+        "affirming": 0,
+        "warning": 1,
+        "contraindicated": 0,
+    }
+
+
+def test_rollup_merge(results):
+    whole = TierRollup()
+    whole.update(results)
+
+    first, second = TierRollup(), TierRollup()
+    first.update(results[:2])
+    second.update(results[2:])
+    merged = pickle.loads(pickle.dumps(first)).merge(pickle.loads(pickle.dumps(second)))
+
+    assert merged.report() == whole.report()
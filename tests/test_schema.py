@@ -0,0 +1,114 @@
+import pytest
+
+from src.claims import AttestationResult
+from src.errors import EARValidationError
+from src.schema import cddl, compile_validator, json_schema
+from src.trust_claims import TrustClaim
+from src.trust_vector import TrustVector
+
+
+def test_json_schema():
+    schema = json_schema()
+    assert schema["title"] == "AttestationResult"
+    assert schema["required"] == ["eat_profile", "iat", "ear.verifier-id"]
+    assert schema["properties"]["submods"] == {
+        "type": "object",
+        "additionalProperties": {"$ref": "#/$defs/submod"},
+    }
+    assert set(schema["$defs"]) == {"verifier-id", "submod", "trust-vector"}
+    assert schema["$defs"]["submod"]["properties"]["ear.status"] == {
+        "enum": [0, 2, 32, 96, "none", "affirming", "warning", "contraindicated"]
+    }
+    assert schema["$defs"]["trust-vector"]["required"] == []
+
+
+def test_json_schema_int_keys():
+    schema = json_schema(keys_as_int=True)
+    assert schema["required"] == ["265", "6", "1004"]
+    assert list(schema["$defs"]["trust-vector"]["properties"]) == [
+        str(key) for key in range(8)
+    ]
+    assert schema["$defs"]["trust-vector"]["properties"]["0"] == {
+        "anyOf": [
+            {"type": "integer", "minimum": -128, "maximum": 127},
+            {"type": "null"},
+        ]
+    }
+
+
+def test_cddl():
+    document = cddl()
+    assert document.startswith("attestation-result = {\n")
+    assert '  "ear.verifier-id" ^ => verifier-id,\n' in document
+    assert '  ? "submods" ^ => { * tstr => submod },\n' in document
+    assert (
+        'trust-tier = 0 / 2 / 32 / 96 / "none" / "affirming" / "warning"'
+        ' / "contraindicated"\n' in document
+    )
+    assert "trust-claim = -128..127\n" in document
+
+
+def test_cddl_int_keys():
+    document = cddl(TrustVector, keys_as_int=True)
+    assert document.startswith("trust-vector = {\n  ? 0 ^ => trust-claim / null,\n")
+
+
+@pytest.mark.parametrize("keys_as_int", [False, True])
+def test_compiled_validator_accepts(sample_attestation_result, keys_as_int):
+    validate = compile_validator(keys_as_int=keys_as_int)
+    validate(sample_attestation_result.to_data(keys_as_int=keys_as_int))
+
+
+def test_compiled_validator_accepts_no_submods(sample_attestation_result):
+    # the library writes an empty map when there are no submods
+    sample_attestation_result.submods = {}
+    data = sample_attestation_result.to_dict()
+    assert data["submods"] == {}
+    compile_validator()(data)
+
+
+@pytest.mark.parametrize("keys_as_int", [False, True])
+def test_compiled_validator_accepts_partial_trust_vector(
+    sample_attestation_result, keys_as_int
+):
+    # unset trust claims may be serialised as null
+    sample_attestation_result.submods["submod1"].trust_vector = TrustVector(
+        executables=TrustClaim(2)
+    )
+    data = sample_attestation_result.to_data(keys_as_int=keys_as_int)
+    compile_validator(keys_as_int=keys_as_int)(data)
+    AttestationResult.from_data(data, keys_as_int=keys_as_int).validate()
+
+
+@pytest.mark.parametrize(
+    "mutate, message",
+    [
+        (lambda data: data.pop("iat"), "missing 'iat'"),
+        (lambda data: data.update(iat=-1), r"\$\.iat"),
+        (lambda data: data.update(iat=True), r"\$\.iat"),
+        (lambda data: data.update(eat_profile=""), "eat_profile"),
+        (lambda data: data["ear.verifier-id"].pop("build"), "missing 'build'"),
+        (lambda data: data.update(submods=[]), "must be a map"),
+        (
+            lambda data: data["submods"]["submod1"].update({"ear.status": 7}),
+            r"submod1\.ear\.status",
+        ),
+        (
+            lambda data: data["submods"]["submod1"][
+                "ear.trustworthiness-vector"
+            ].update(hardware=200),
+            "hardware: must be an integer in",
+        ),
+    ],
+)
+def test_compiled_validator_rejects(sample_attestation_result, mutate, message):
+    data = sample_attestation_result.to_dict()
+    mutate(data)
+    with pytest.raises(EARValidationError, match=message):
+        compile_validator()(data)
+
+
+def test_compiled_validator_ignores_unknown_keys(sample_attestation_result):
+    data = sample_attestation_result.to_dict()
+    data["exp"] = 1234567890
+    compile_validator()(data)
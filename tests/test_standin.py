@@ -0,0 +1,120 @@
+import asyncio
+import json
+
+import pytest
+
+from src.claims import AttestationResult
+from src.clock import FixedClock
+from src.replay import ReplayDetector
+from src.standin import LoadReport, StandinClient, StandinVerifier, run_load
+from src.submod import Submod
+from src.trust_claims import TrustClaim
+from src.trust_tier import TRUST_TIER_AFFIRMING
+from src.trust_vector import TrustVector
+
+NOW = 1_700_000_000
+
+
+@pytest.fixture
+def verdict():
+    submod = Submod(
+        trust_vector=TrustVector(*(TrustClaim(2) for _ in range(8))),
+        status=TRUST_TIER_AFFIRMING,
+    )
+    return {"submods": {"submod1": submod.to_dict()}, "eat_nonce": "nonce-1"}
+
+
+@pytest.fixture
+def verifier():
+    clock = FixedClock(NOW)
+    return StandinVerifier(
+        "secret", clock=clock, replay_detector=ReplayDetector(clock=clock)
+    )
+
+
+def test_issue_and_verify(verifier, verdict):
+    token = verifier.issue(verdict)
+    result = AttestationResult.decode_jwt(token, "secret", clock=FixedClock(NOW))
+    assert result.issued_at == NOW
+    assert result.nonce == "nonce-1"
+    assert result.submods["submod1"].status == TRUST_TIER_AFFIRMING
+    assert verifier.verify(token) == result.to_dict()
+
+
+def test_verify_rejects_replay(verifier, verdict):
+    token = verifier.issue(verdict)
+    verifier.verify(token)
+    with pytest.raises(ValueError, match="replayed"):
+        verifier.verify(token)
+
+
+@pytest.mark.parametrize(
+    "method, path, body, status",
+    [
+        ("GET", "/issue", b"", 404),
+        ("POST", "/other", b"", 404),
+        ("POST", "/issue", b"not json", 400),
+        ("POST", "/issue", b"[]", 400),
+        ("POST", "/issue", b'"verdict"', 400),
+        ("POST", "/issue", b'{"submods": []}', 400),
+        ("POST", "/issue", b'{"submods": {"a": 2}}', 400),
+        (
+            "POST",
+            "/issue",
+            b'{"submods": {"a": {"ear.status": 2, "ear.trustworthiness-vector": 5}}}',
+            400,
+        ),
+        ("POST", "/issue", b'{"submods": {"a": {"ear.status": 7}}}', 400),
+        ("POST", "/verify", b"not.a.token", 401),
+    ],
+)
+def test_handle_errors(verifier, method, path, body, status):
+    code, payload = verifier.handle(method, path, body)
+    assert code == status
+    assert "error" in json.loads(payload)
+
+
+def test_http_roundtrip(verifier, verdict):
+    async def scenario():
+        server = await verifier.start()
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            client = await StandinClient.connect("127.0.0.1", port)
+            status, body = await client.issue(verdict)
+            assert status == 200
+            token = json.loads(body)["token"]
+            status, body = await client.verify(token)
+            assert status == 200
+            assert json.loads(body)["eat_nonce"] == "nonce-1"
+            status, _ = await client.verify(token)
+            assert status == 401
+            await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_run_load(verdict):
+    async def scenario():
+        server = await StandinVerifier(
+            "secret", replay_detector=ReplayDetector()
+        ).start()
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await run_load(
+                "127.0.0.1", port, verdict, requests=50, concurrency=4
+            )
+
+    reports = asyncio.run(scenario())
+    for report in reports.values():
+        assert len(report.latencies) == 50
+        assert report.errors == 0
+        assert report.throughput > 0
+
+
+def test_load_report_percentile():
+    report = LoadReport(latencies=[float(n) for n in range(100, 0, -1)], elapsed=2)
+    assert report.percentile(50) == 50
+    assert report.percentile(99) == 99
+    assert report.percentile(100) == 100
+    assert report.throughput == 50
+    assert LoadReport().percentile(50) == 0
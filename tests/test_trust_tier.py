@@ -5,6 +5,7 @@ from src.trust_tier import (
     TRUST_TIER_CONTRAINDICATED,
     TRUST_TIER_NONE,
     TRUST_TIER_WARNING,
+    claim_tier,
     to_trust_tier,
 )
 
@@ -37,3 +38,29 @@ def test_to_trust_tier_invalid_type():
 
     with pytest.raises(ValueError):
         to_trust_tier({"tier": "affirming"})
+
+
+@pytest.mark.parametrize(
+    "value, tier",
+    [
+        (0, TRUST_TIER_NONE),
+        (-1, TRUST_TIER_NONE),
+        (1, TRUST_TIER_NONE),
+        (2, TRUST_TIER_AFFIRMING),
+        (31, TRUST_TIER_AFFIRMING),
+        (-32, TRUST_TIER_AFFIRMING),
+        (32, TRUST_TIER_WARNING),
+        (95, TRUST_TIER_WARNING),
+        (-33, TRUST_TIER_WARNING),
+        (96, TRUST_TIER_CONTRAINDICATED),
+        (127, TRUST_TIER_CONTRAINDICATED),
+        (-128, TRUST_TIER_CONTRAINDICATED),
+    ],
+)
+def test_claim_tier(value, tier):
+    assert claim_tier(value) == tier
+
+
+def test_claim_tier_out_of_range():
+    with pytest.raises(ValueError):
+        claim_tier(128)
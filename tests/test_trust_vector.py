@@ -108,3 +108,13 @@ def test_validate_trust_vector_invalid():
             configuration=TrustClaim(value=200, tag="invalid", short="", long="")
         )
         invalid_vector.validate()
+
+
+def test_partial_trust_vector_roundtrip():
+    vector = TrustVector(instance_identity=TRUSTWORTHY_INSTANCE_CLAIM)
+    assert vector.to_dict() == {"instance-identity": TRUSTWORTHY_INSTANCE_CLAIM.value}
+    parsed = TrustVector.from_dict(vector.to_dict())
+    assert parsed.configuration is None
+    parsed.validate()
+    # an explicit null is read as an unset claim
+    assert TrustVector.from_dict({"configuration": None}).configuration is None